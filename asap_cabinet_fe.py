@@ -6,12 +6,14 @@
                   A Dual-screen VPX Python Front-End
                 ---------------------------------------
     Features:
-    - Scans VPX_ROOT_FOLDER recursively for .vpx files.
+    - Scans the VPX_ROOT_FOLDER folders recursively for .vpx files, falling
+      back to the last known tables of slow or offline network folders
     - For each table, uses:
         - Table image: table.png (or DEFAULT_TABLE_IMAGE if missing)
         - Backglass image: backglass.png (or DEFAULT_BACKGLASS_IMAGE if missing)
         - Wheel image: wheel.png (or DEFAULT_WHEEL_IMAGE if missing)
-        - DMD animation: dmd.gif (or DEFAULT_DMD_VIDEO if missing)
+        - DMD animation: dmd.gif (or DEFAULT_DMD_VIDEO if missing), drawn as a
+          dot matrix from compact native-resolution frames when it is DMD-sized
     - Main Window (1080x1920): Displays table image full screen with wheel overlay
     - Secondary Window (1280x1024): Displays backglass image and DMD
     - Uses left/right arrow/shift keys for infinite scrolling between tables
@@ -19,33 +21,67 @@
     - Press Enter to launch table
     - Settings button to configure for your setup
     - Search button by query (jump to letter soon!)
+    - Remembers the last table and pre-loads the most played ones
+    - Shows a snapshot of the last screen instantly at boot
+    - Slows animations down when idle, with an optional attract mode
+    - Wheel carousel of the neighbouring tables, drawn from a pre-built atlas
+    - Reads table name, author, version and screenshot from inside each .vpx
+    - Low-latency navigation sounds and per-table audio previews (audio/preview.ogg)
+    - Pre-reads the selected table's files so VPX starts from a warm cache
 
 Dependencies: python3, python3-pyqt5, python3-pyqt5.qtmultimedia
+(vpx_metadata.py must sit next to this file)
 
 Tarso Galvão - Feb/2025
 """
 
 import os
+import re
 import sys
+import json
+import mmap
+import time
+import hashlib
+import queue
+import itertools
+import threading
+import struct
 import subprocess
 import configparser
+import unicodedata
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
+from PyQt5 import sip
 from PyQt5.QtCore import (
-    Qt, QPropertyAnimation, QEasingCurve, QSize, QTimer
+    Qt, QPropertyAnimation, QEasingCurve, QSize, QTimer, QRect, QRectF,
+    QObject, QEvent, QAbstractAnimation, QVariantAnimation, QUrl, pyqtSignal
 )
 from PyQt5.QtGui import (
-    QPixmap, QPalette, QColor, QGuiApplication, QFont, QFontMetrics, QMovie
+    QPixmap, QPalette, QColor, QGuiApplication, QFont, QFontMetrics, QMovie,
+    QImage, QImageReader, QPainter
 )
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QLabel, QWidget, QGraphicsOpacityEffect,
     QVBoxLayout, QScrollArea, QDialog, QFormLayout, QLineEdit,
     QDialogButtonBox, QPushButton, QMessageBox
 )
-from PyQt5.QtMultimedia import QSound
+from PyQt5.QtMultimedia import QSoundEffect, QMediaPlayer, QMediaContent
+
+from vpx_metadata import extract_vpx_metadata
 
 # ### Configuration Defaults
 
 CONFIG_FILE = os.path.expanduser("~/.asap-cabinet-fe/settings.ini")
+STATS_FILE = os.path.expanduser("~/.asap-cabinet-fe/stats.json")
+SNAPSHOT_PLAYFIELD = os.path.expanduser("~/.asap-cabinet-fe/snapshot/playfield.raw")
+SNAPSHOT_BACKGLASS = os.path.expanduser("~/.asap-cabinet-fe/snapshot/backglass.raw")
+WHEEL_ATLAS_DIR = os.path.expanduser("~/.asap-cabinet-fe/wheel_atlas/")
+FRAME_CACHE_DIR = os.path.expanduser("~/.asap-cabinet-fe/frames/")
+METADATA_FILE = os.path.expanduser("~/.asap-cabinet-fe/metadata.json")
+SCREENSHOT_DIR = os.path.expanduser("~/.asap-cabinet-fe/screenshots/")
+LIBRARY_INDEX_DIR = os.path.expanduser("~/.asap-cabinet-fe/library/")
 
 # **Default Media Paths**
 DEFAULT_TABLE_IMAGE = "img/default_table.png"
@@ -69,6 +105,7 @@ SND_TABLE_LOAD = "snd/table_load.wav"
 VPX_ROOT_FOLDER = os.path.expanduser("~/Games/vpinball/build/tables/")
 VPX_EXECUTABLE = os.path.expanduser("~/Games/vpinball/build/VPinballX_GL")
 EXECUTABLE_SUB_CMD = "-Play"
+ROOT_SCAN_TIMEOUT = 10
 
 CUSTOM_TABLE_IMAGE = "images/table.png"
 CUSTOM_WHEEL_IMAGE = "images/wheel.png"
@@ -77,6 +114,7 @@ CUSTOM_MARQUEE_IMAGE = "images/marquee.png"
 CUSTOM_TABLE_VIDEO = "video/table.gif"
 CUSTOM_BACKGLASS_VIDEO = "video/backglass.gif"
 CUSTOM_DMD_VIDEO = "video/dmd.gif"
+CUSTOM_TABLE_AUDIO = "audio/preview.ogg"
 
 # **Main Window Settings**
 MAIN_MONITOR_INDEX = 1
@@ -84,10 +122,14 @@ MAIN_WINDOW_WIDTH = 1080
 MAIN_WINDOW_HEIGHT = 1920
 WHEEL_IMAGE_SIZE = 250
 WHEEL_IMAGE_MARGIN = 24
+WHEEL_CAROUSEL_COUNT = 3
+WHEEL_CAROUSEL_SIZE = 96
 FONT_NAME = "Arial"
 FONT_SIZE = 22
 BG_COLOR = "#202020"
 TEXT_COLOR = "white"
+METADATA_NAMES = True
+TABLE_SORT = "name"
 
 # **Secondary Window Settings**
 SECONDARY_MONITOR_INDEX = 0
@@ -97,23 +139,52 @@ BACKGLASS_IMAGE_WIDTH = 1024
 BACKGLASS_IMAGE_HEIGHT = 768
 DMD_WIDTH = 1024
 DMD_HEIGHT = 256
+DMD_DOT_MATRIX = True
+DMD_NATIVE_WIDTH = 128
+DMD_NATIVE_HEIGHT = 32
 
 # **Transition Settings**
 FADE_DURATION = 300
 FADE_OPACITY = 0.5
 
+# **Performance Settings**
+MEDIA_CACHE_MB = 256
+WARM_CACHE_TABLES = 20
+BOOT_SNAPSHOT = True
+DEFAULT_IDLE_TIERS = "120:50,600:20,1800:0"
+IDLE_TIERS = DEFAULT_IDLE_TIERS
+ATTRACT_MODE_INTERVAL = 0
+FRAME_CACHE = False
+FRAME_CACHE_MB = 4096
+METADATA_WORKERS = 0
+READAHEAD_DELAY = 1500
+READAHEAD_MB = 1024
+
+# **Sound Settings**
+SOUND_VOLUME = 100
+SOUND_POLYPHONY = 3
+SOUND_REPEAT_INTERVAL = 90
+TABLE_PREVIEW = True
+PREVIEW_VOLUME = 60
+PREVIEW_DELAY = 600
+
 # ### Configuration Loader
 
 def load_configuration():
     """Load settings from INI file or create one with defaults if it doesn't exist."""
-    global VPX_ROOT_FOLDER, VPX_EXECUTABLE, EXECUTABLE_SUB_CMD
+    global VPX_ROOT_FOLDER, VPX_EXECUTABLE, EXECUTABLE_SUB_CMD, ROOT_SCAN_TIMEOUT
     global CUSTOM_TABLE_IMAGE, CUSTOM_WHEEL_IMAGE, CUSTOM_BACKGLASS_IMAGE, CUSTOM_MARQUEE_IMAGE
-    global CUSTOM_TABLE_VIDEO, CUSTOM_BACKGLASS_VIDEO, CUSTOM_DMD_VIDEO
+    global CUSTOM_TABLE_VIDEO, CUSTOM_BACKGLASS_VIDEO, CUSTOM_DMD_VIDEO, CUSTOM_TABLE_AUDIO
     global MAIN_MONITOR_INDEX, MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT
     global SECONDARY_MONITOR_INDEX, BACKGLASS_WINDOW_WIDTH, BACKGLASS_WINDOW_HEIGHT
     global BACKGLASS_IMAGE_WIDTH, BACKGLASS_IMAGE_HEIGHT, DMD_WIDTH, DMD_HEIGHT
+    global DMD_DOT_MATRIX, DMD_NATIVE_WIDTH, DMD_NATIVE_HEIGHT
     global WHEEL_IMAGE_SIZE, WHEEL_IMAGE_MARGIN, FONT_NAME, FONT_SIZE
+    global WHEEL_CAROUSEL_COUNT, WHEEL_CAROUSEL_SIZE, METADATA_NAMES, TABLE_SORT
     global BG_COLOR, TEXT_COLOR, FADE_DURATION, FADE_OPACITY
+    global MEDIA_CACHE_MB, WARM_CACHE_TABLES, BOOT_SNAPSHOT, IDLE_TIERS, ATTRACT_MODE_INTERVAL
+    global FRAME_CACHE, FRAME_CACHE_MB, METADATA_WORKERS, READAHEAD_DELAY, READAHEAD_MB
+    global SOUND_VOLUME, SOUND_POLYPHONY, SOUND_REPEAT_INTERVAL, TABLE_PREVIEW, PREVIEW_VOLUME, PREVIEW_DELAY
 
     ini_file = os.path.expanduser(CONFIG_FILE)
     config = configparser.ConfigParser()
@@ -123,12 +194,17 @@ def load_configuration():
 
     if os.path.exists(ini_file):
         config.read(ini_file)
+        # Sections added after the first release may be missing from older files
+        for section in ("Performance", "Sound"):
+            if not config.has_section(section):
+                config.add_section(section)
     else:
         # Create default configuration
         config['Main Paths'] = {
             "VPX_ROOT_FOLDER": VPX_ROOT_FOLDER,
             "VPX_EXECUTABLE": VPX_EXECUTABLE,
             "EXECUTABLE_SUB_CMD": EXECUTABLE_SUB_CMD,
+            "ROOT_SCAN_TIMEOUT": str(ROOT_SCAN_TIMEOUT),
         }
         config['Custom Media'] = {
             "CUSTOM_TABLE_IMAGE": CUSTOM_TABLE_IMAGE,
@@ -138,6 +214,7 @@ def load_configuration():
             "CUSTOM_TABLE_VIDEO": CUSTOM_TABLE_VIDEO,
             "CUSTOM_BACKGLASS_VIDEO": CUSTOM_BACKGLASS_VIDEO,
             "CUSTOM_DMD_VIDEO": CUSTOM_DMD_VIDEO,
+            "CUSTOM_TABLE_AUDIO": CUSTOM_TABLE_AUDIO,
         }
         config['Main Window'] = {
             "MAIN_MONITOR_INDEX": str(MAIN_MONITOR_INDEX),
@@ -145,10 +222,14 @@ def load_configuration():
             "MAIN_WINDOW_HEIGHT": str(MAIN_WINDOW_HEIGHT),
             "WHEEL_IMAGE_SIZE": str(WHEEL_IMAGE_SIZE),
             "WHEEL_IMAGE_MARGIN": str(WHEEL_IMAGE_MARGIN),
+            "WHEEL_CAROUSEL_COUNT": str(WHEEL_CAROUSEL_COUNT),
+            "WHEEL_CAROUSEL_SIZE": str(WHEEL_CAROUSEL_SIZE),
             "FONT_NAME": FONT_NAME,
             "FONT_SIZE": str(FONT_SIZE),
             "BG_COLOR": BG_COLOR,
             "TEXT_COLOR": TEXT_COLOR,
+            "METADATA_NAMES": str(METADATA_NAMES),
+            "TABLE_SORT": TABLE_SORT,
         }
         config['Secondary Window'] = {
             "SECONDARY_MONITOR_INDEX": str(SECONDARY_MONITOR_INDEX),
@@ -158,11 +239,34 @@ def load_configuration():
             "BACKGLASS_IMAGE_HEIGHT": str(BACKGLASS_IMAGE_HEIGHT),
             "DMD_WIDTH": str(DMD_WIDTH),
             "DMD_HEIGHT": str(DMD_HEIGHT),
+            "DMD_DOT_MATRIX": str(DMD_DOT_MATRIX),
+            "DMD_NATIVE_WIDTH": str(DMD_NATIVE_WIDTH),
+            "DMD_NATIVE_HEIGHT": str(DMD_NATIVE_HEIGHT),
         }
         config['Transition Settings'] = {
             "FADE_DURATION": str(FADE_DURATION),
             "FADE_OPACITY": str(FADE_OPACITY),
         }
+        config['Performance'] = {
+            "MEDIA_CACHE_MB": str(MEDIA_CACHE_MB),
+            "WARM_CACHE_TABLES": str(WARM_CACHE_TABLES),
+            "BOOT_SNAPSHOT": str(BOOT_SNAPSHOT),
+            "IDLE_TIERS": IDLE_TIERS,
+            "ATTRACT_MODE_INTERVAL": str(ATTRACT_MODE_INTERVAL),
+            "FRAME_CACHE": str(FRAME_CACHE),
+            "FRAME_CACHE_MB": str(FRAME_CACHE_MB),
+            "METADATA_WORKERS": str(METADATA_WORKERS),
+            "READAHEAD_DELAY": str(READAHEAD_DELAY),
+            "READAHEAD_MB": str(READAHEAD_MB),
+        }
+        config['Sound'] = {
+            "SOUND_VOLUME": str(SOUND_VOLUME),
+            "SOUND_POLYPHONY": str(SOUND_POLYPHONY),
+            "SOUND_REPEAT_INTERVAL": str(SOUND_REPEAT_INTERVAL),
+            "TABLE_PREVIEW": str(TABLE_PREVIEW),
+            "PREVIEW_VOLUME": str(PREVIEW_VOLUME),
+            "PREVIEW_DELAY": str(PREVIEW_DELAY),
+        }
         with open(ini_file, "w") as f:
             config.write(f)
 
@@ -171,6 +275,7 @@ def load_configuration():
     VPX_ROOT_FOLDER = p.get("VPX_ROOT_FOLDER", VPX_ROOT_FOLDER)
     VPX_EXECUTABLE = p.get("VPX_EXECUTABLE", VPX_EXECUTABLE)
     EXECUTABLE_SUB_CMD = p.get("EXECUTABLE_SUB_CMD", EXECUTABLE_SUB_CMD)
+    ROOT_SCAN_TIMEOUT = int(p.get("ROOT_SCAN_TIMEOUT", ROOT_SCAN_TIMEOUT))
 
     ci = config['Custom Media']
     CUSTOM_TABLE_IMAGE = ci.get("CUSTOM_TABLE_IMAGE", CUSTOM_TABLE_IMAGE)
@@ -180,6 +285,7 @@ def load_configuration():
     CUSTOM_TABLE_VIDEO = ci.get("CUSTOM_TABLE_VIDEO", CUSTOM_TABLE_VIDEO)
     CUSTOM_BACKGLASS_VIDEO = ci.get("CUSTOM_BACKGLASS_VIDEO", CUSTOM_BACKGLASS_VIDEO)
     CUSTOM_DMD_VIDEO = ci.get("CUSTOM_DMD_VIDEO", CUSTOM_DMD_VIDEO)
+    CUSTOM_TABLE_AUDIO = ci.get("CUSTOM_TABLE_AUDIO", CUSTOM_TABLE_AUDIO)
 
     mw = config['Main Window']
     MAIN_MONITOR_INDEX = int(mw.get("MAIN_MONITOR_INDEX", MAIN_MONITOR_INDEX))
@@ -187,10 +293,14 @@ def load_configuration():
     MAIN_WINDOW_HEIGHT = int(mw.get("MAIN_WINDOW_HEIGHT", MAIN_WINDOW_HEIGHT))
     WHEEL_IMAGE_SIZE = int(mw.get("WHEEL_IMAGE_SIZE", WHEEL_IMAGE_SIZE))
     WHEEL_IMAGE_MARGIN = int(mw.get("WHEEL_IMAGE_MARGIN", WHEEL_IMAGE_MARGIN))
+    WHEEL_CAROUSEL_COUNT = int(mw.get("WHEEL_CAROUSEL_COUNT", WHEEL_CAROUSEL_COUNT))
+    WHEEL_CAROUSEL_SIZE = int(mw.get("WHEEL_CAROUSEL_SIZE", WHEEL_CAROUSEL_SIZE))
     FONT_NAME = mw.get("FONT_NAME", FONT_NAME)
     FONT_SIZE = int(mw.get("FONT_SIZE", FONT_SIZE))
     BG_COLOR = mw.get("BG_COLOR", BG_COLOR)
     TEXT_COLOR = mw.get("TEXT_COLOR", TEXT_COLOR)
+    METADATA_NAMES = mw.getboolean("METADATA_NAMES", fallback=METADATA_NAMES)
+    TABLE_SORT = mw.get("TABLE_SORT", TABLE_SORT).strip().lower()
 
     sw = config['Secondary Window']
     SECONDARY_MONITOR_INDEX = int(sw.get("SECONDARY_MONITOR_INDEX", SECONDARY_MONITOR_INDEX))
@@ -200,19 +310,40 @@ def load_configuration():
     BACKGLASS_IMAGE_HEIGHT = int(sw.get("BACKGLASS_IMAGE_HEIGHT", BACKGLASS_IMAGE_HEIGHT))
     DMD_WIDTH = int(sw.get("DMD_WIDTH", DMD_WIDTH))
     DMD_HEIGHT = int(sw.get("DMD_HEIGHT", DMD_HEIGHT))
+    DMD_DOT_MATRIX = sw.getboolean("DMD_DOT_MATRIX", fallback=DMD_DOT_MATRIX)
+    DMD_NATIVE_WIDTH = int(sw.get("DMD_NATIVE_WIDTH", DMD_NATIVE_WIDTH))
+    DMD_NATIVE_HEIGHT = int(sw.get("DMD_NATIVE_HEIGHT", DMD_NATIVE_HEIGHT))
 
     t = config['Transition Settings']
     FADE_DURATION = int(t.get("FADE_DURATION", FADE_DURATION))
     FADE_OPACITY = float(t.get("FADE_OPACITY", FADE_OPACITY))
 
-# Load configuration at startup
-load_configuration()
+    pf = config['Performance']
+    MEDIA_CACHE_MB = int(pf.get("MEDIA_CACHE_MB", MEDIA_CACHE_MB))
+    WARM_CACHE_TABLES = int(pf.get("WARM_CACHE_TABLES", WARM_CACHE_TABLES))
+    BOOT_SNAPSHOT = pf.getboolean("BOOT_SNAPSHOT", fallback=BOOT_SNAPSHOT)
+    IDLE_TIERS = pf.get("IDLE_TIERS", IDLE_TIERS)
+    ATTRACT_MODE_INTERVAL = int(pf.get("ATTRACT_MODE_INTERVAL", ATTRACT_MODE_INTERVAL))
+    FRAME_CACHE = pf.getboolean("FRAME_CACHE", fallback=FRAME_CACHE)
+    FRAME_CACHE_MB = int(pf.get("FRAME_CACHE_MB", FRAME_CACHE_MB))
+    METADATA_WORKERS = int(pf.get("METADATA_WORKERS", METADATA_WORKERS))
+    READAHEAD_DELAY = int(pf.get("READAHEAD_DELAY", READAHEAD_DELAY))
+    READAHEAD_MB = int(pf.get("READAHEAD_MB", READAHEAD_MB))
+
+    sd = config['Sound']
+    SOUND_VOLUME = int(sd.get("SOUND_VOLUME", SOUND_VOLUME))
+    SOUND_POLYPHONY = int(sd.get("SOUND_POLYPHONY", SOUND_POLYPHONY))
+    SOUND_REPEAT_INTERVAL = int(sd.get("SOUND_REPEAT_INTERVAL", SOUND_REPEAT_INTERVAL))
+    TABLE_PREVIEW = sd.getboolean("TABLE_PREVIEW", fallback=TABLE_PREVIEW)
+    PREVIEW_VOLUME = int(sd.get("PREVIEW_VOLUME", PREVIEW_VOLUME))
+    PREVIEW_DELAY = int(sd.get("PREVIEW_DELAY", PREVIEW_DELAY))
 
 # ### Settings Dialog
 
 class SettingsDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, library=None):
         super().__init__(parent)
+        self.library = library or LibraryScanner()
         self.setFixedSize(SETTINGS_WIDTH, SETTINGS_HEIGHT)
         self.setWindowTitle(f"[Settings] {CONFIG_FILE.replace(os.path.expanduser('~'), '~')}")
 
@@ -225,6 +356,7 @@ class SettingsDialog(QDialog):
         self.vpxRootEdit = QLineEdit(VPX_ROOT_FOLDER)
         self.execCmdEdit = QLineEdit(VPX_EXECUTABLE)
         self.execSubCmdEdit = QLineEdit(EXECUTABLE_SUB_CMD)
+        self.scanTimeoutEdit = QLineEdit(str(ROOT_SCAN_TIMEOUT))
         self.tableImageEdit = QLineEdit(CUSTOM_TABLE_IMAGE)
         self.wheelImageEdit = QLineEdit(CUSTOM_WHEEL_IMAGE)
         self.backglassImageEdit = QLineEdit(CUSTOM_BACKGLASS_IMAGE)
@@ -232,6 +364,7 @@ class SettingsDialog(QDialog):
         self.videoTableEdit = QLineEdit(CUSTOM_TABLE_VIDEO)
         self.videoBackglassEdit = QLineEdit(CUSTOM_BACKGLASS_VIDEO)
         self.dmdTableEdit = QLineEdit(CUSTOM_DMD_VIDEO)
+        self.tableAudioEdit = QLineEdit(CUSTOM_TABLE_AUDIO)
         self.mainMonitor = QLineEdit(str(MAIN_MONITOR_INDEX))
         self.windowWidthEdit = QLineEdit(str(MAIN_WINDOW_WIDTH))
         self.windowHeightEdit = QLineEdit(str(MAIN_WINDOW_HEIGHT))
@@ -242,20 +375,44 @@ class SettingsDialog(QDialog):
         self.backglassImageHeightEdit = QLineEdit(str(BACKGLASS_IMAGE_HEIGHT))
         self.dmdWidthEdit = QLineEdit(str(DMD_WIDTH))
         self.dmdHeightEdit = QLineEdit(str(DMD_HEIGHT))
+        self.dmdDotMatrixEdit = QLineEdit(str(DMD_DOT_MATRIX))
+        self.dmdNativeWidthEdit = QLineEdit(str(DMD_NATIVE_WIDTH))
+        self.dmdNativeHeightEdit = QLineEdit(str(DMD_NATIVE_HEIGHT))
         self.wheelSizeEdit = QLineEdit(str(WHEEL_IMAGE_SIZE))
         self.wheelMarginEdit = QLineEdit(str(WHEEL_IMAGE_MARGIN))
+        self.carouselCountEdit = QLineEdit(str(WHEEL_CAROUSEL_COUNT))
+        self.carouselSizeEdit = QLineEdit(str(WHEEL_CAROUSEL_SIZE))
         self.fontNameEdit = QLineEdit(FONT_NAME)
         self.fontSizeEdit = QLineEdit(str(FONT_SIZE))
         self.bgColorEdit = QLineEdit(BG_COLOR)
         self.textColorEdit = QLineEdit(TEXT_COLOR)
+        self.metadataNamesEdit = QLineEdit(str(METADATA_NAMES))
+        self.tableSortEdit = QLineEdit(TABLE_SORT)
         self.fadeDurationEdit = QLineEdit(str(FADE_DURATION))
         self.fadeOpacityEdit = QLineEdit(str(FADE_OPACITY))
+        self.mediaCacheEdit = QLineEdit(str(MEDIA_CACHE_MB))
+        self.warmCacheEdit = QLineEdit(str(WARM_CACHE_TABLES))
+        self.bootSnapshotEdit = QLineEdit(str(BOOT_SNAPSHOT))
+        self.idleTiersEdit = QLineEdit(IDLE_TIERS)
+        self.attractIntervalEdit = QLineEdit(str(ATTRACT_MODE_INTERVAL))
+        self.frameCacheEdit = QLineEdit(str(FRAME_CACHE))
+        self.frameCacheSizeEdit = QLineEdit(str(FRAME_CACHE_MB))
+        self.metadataWorkersEdit = QLineEdit(str(METADATA_WORKERS))
+        self.readaheadDelayEdit = QLineEdit(str(READAHEAD_DELAY))
+        self.readaheadSizeEdit = QLineEdit(str(READAHEAD_MB))
+        self.soundVolumeEdit = QLineEdit(str(SOUND_VOLUME))
+        self.soundPolyphonyEdit = QLineEdit(str(SOUND_POLYPHONY))
+        self.soundRepeatEdit = QLineEdit(str(SOUND_REPEAT_INTERVAL))
+        self.tablePreviewEdit = QLineEdit(str(TABLE_PREVIEW))
+        self.previewVolumeEdit = QLineEdit(str(PREVIEW_VOLUME))
+        self.previewDelayEdit = QLineEdit(str(PREVIEW_DELAY))
 
         # Add fields to layout
         self.add_section_title("Main Paths")
-        self.layout.addRow("Tables Folder:", self.vpxRootEdit)
+        self.layout.addRow(f"Tables Folders ('{os.pathsep}' separated):", self.vpxRootEdit)
         self.layout.addRow("VPX Executable:", self.execCmdEdit)
         self.layout.addRow("VPX Argument:", self.execSubCmdEdit)
+        self.layout.addRow("Folder Scan Timeout (sec):", self.scanTimeoutEdit)
 
         self.add_section_title("Custom Media")
         self.layout.addRow("Playfield Images Path:", self.tableImageEdit)
@@ -265,6 +422,7 @@ class SettingsDialog(QDialog):
         self.layout.addRow("Playfield GIFs Path:", self.videoTableEdit)
         self.layout.addRow("Backglass GIFs Path:", self.videoBackglassEdit)
         self.layout.addRow("DMD GIFs Path:", self.dmdTableEdit)
+        self.layout.addRow("Audio Preview Path:", self.tableAudioEdit)
 
         self.add_section_title("Main Window")
         self.layout.addRow("Playfield Monitor:", self.mainMonitor)
@@ -272,10 +430,14 @@ class SettingsDialog(QDialog):
         self.layout.addRow("Playfield Height:", self.windowHeightEdit)
         self.layout.addRow("Wheel Size:", self.wheelSizeEdit)
         self.layout.addRow("Wheel Margin:", self.wheelMarginEdit)
+        self.layout.addRow("Carousel Wheels per Side:", self.carouselCountEdit)
+        self.layout.addRow("Carousel Wheel Size:", self.carouselSizeEdit)
         self.layout.addRow("Font Name:", self.fontNameEdit)
         self.layout.addRow("Font Size:", self.fontSizeEdit)
         self.layout.addRow("Background Color:", self.bgColorEdit)
         self.layout.addRow("Text Color:", self.textColorEdit)
+        self.layout.addRow("Names from Table Info:", self.metadataNamesEdit)
+        self.layout.addRow("Sort by (name/author/year/file):", self.tableSortEdit)
 
         self.add_section_title("Secondary Window")
         self.layout.addRow("Backglass Monitor:", self.secondaryMonitor)
@@ -285,11 +447,34 @@ class SettingsDialog(QDialog):
         self.layout.addRow("Backglass Image Height:", self.backglassImageHeightEdit)
         self.layout.addRow("DMD Width:", self.dmdWidthEdit)
         self.layout.addRow("DMD Height:", self.dmdHeightEdit)
+        self.layout.addRow("DMD Dot Matrix:", self.dmdDotMatrixEdit)
+        self.layout.addRow("DMD Dots Width:", self.dmdNativeWidthEdit)
+        self.layout.addRow("DMD Dots Height:", self.dmdNativeHeightEdit)
 
         self.add_section_title("Transition Settings")
         self.layout.addRow("Transition Duration:", self.fadeDurationEdit)
         self.layout.addRow("Fade Opacity:", self.fadeOpacityEdit)
 
+        self.add_section_title("Performance")
+        self.layout.addRow("Media Cache (MB):", self.mediaCacheEdit)
+        self.layout.addRow("Tables to Pre-load:", self.warmCacheEdit)
+        self.layout.addRow("Boot Snapshot:", self.bootSnapshotEdit)
+        self.layout.addRow("Idle Tiers (sec:speed%):", self.idleTiersEdit)
+        self.layout.addRow("Attract Interval (sec):", self.attractIntervalEdit)
+        self.layout.addRow("GIF Frame Cache:", self.frameCacheEdit)
+        self.layout.addRow("GIF Frame Cache (MB):", self.frameCacheSizeEdit)
+        self.layout.addRow("Metadata Workers (0 = auto):", self.metadataWorkersEdit)
+        self.layout.addRow("Table Pre-read Delay (ms):", self.readaheadDelayEdit)
+        self.layout.addRow("Table Pre-read Budget (MB):", self.readaheadSizeEdit)
+
+        self.add_section_title("Sound")
+        self.layout.addRow("Effects Volume (%):", self.soundVolumeEdit)
+        self.layout.addRow("Effects Polyphony:", self.soundPolyphonyEdit)
+        self.layout.addRow("Key Repeat Interval (ms):", self.soundRepeatEdit)
+        self.layout.addRow("Table Audio Preview:", self.tablePreviewEdit)
+        self.layout.addRow("Preview Volume (%):", self.previewVolumeEdit)
+        self.layout.addRow("Preview Delay (ms):", self.previewDelayEdit)
+
         # Add buttons
         self.buttonBox = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         self.buttonBox.accepted.connect(self.accept)
@@ -316,6 +501,7 @@ class SettingsDialog(QDialog):
             "VPX_ROOT_FOLDER": self.vpxRootEdit.text(),
             "VPX_EXECUTABLE": self.execCmdEdit.text(),
             "EXECUTABLE_SUB_CMD": self.execSubCmdEdit.text(),
+            "ROOT_SCAN_TIMEOUT": self.scanTimeoutEdit.text(),
             "CUSTOM_TABLE_IMAGE": self.tableImageEdit.text(),
             "CUSTOM_WHEEL_IMAGE": self.wheelImageEdit.text(),
             "CUSTOM_BACKGLASS_IMAGE": self.backglassImageEdit.text(),
@@ -323,6 +509,7 @@ class SettingsDialog(QDialog):
             "CUSTOM_TABLE_VIDEO": self.videoTableEdit.text(),
             "CUSTOM_BACKGLASS_VIDEO": self.videoBackglassEdit.text(),
             "CUSTOM_DMD_VIDEO": self.dmdTableEdit.text(),
+            "CUSTOM_TABLE_AUDIO": self.tableAudioEdit.text(),
             "MAIN_MONITOR_INDEX": self.mainMonitor.text(),
             "MAIN_WINDOW_WIDTH": self.windowWidthEdit.text(),
             "MAIN_WINDOW_HEIGHT": self.windowHeightEdit.text(),
@@ -333,14 +520,37 @@ class SettingsDialog(QDialog):
             "BACKGLASS_IMAGE_HEIGHT": self.backglassImageHeightEdit.text(),
             "DMD_WIDTH": self.dmdWidthEdit.text(),
             "DMD_HEIGHT": self.dmdHeightEdit.text(),
+            "DMD_DOT_MATRIX": self.dmdDotMatrixEdit.text(),
+            "DMD_NATIVE_WIDTH": self.dmdNativeWidthEdit.text(),
+            "DMD_NATIVE_HEIGHT": self.dmdNativeHeightEdit.text(),
             "WHEEL_IMAGE_SIZE": self.wheelSizeEdit.text(),
             "WHEEL_IMAGE_MARGIN": self.wheelMarginEdit.text(),
+            "WHEEL_CAROUSEL_COUNT": self.carouselCountEdit.text(),
+            "WHEEL_CAROUSEL_SIZE": self.carouselSizeEdit.text(),
             "FONT_NAME": self.fontNameEdit.text(),
             "FONT_SIZE": self.fontSizeEdit.text(),
             "BG_COLOR": self.bgColorEdit.text(),
             "TEXT_COLOR": self.textColorEdit.text(),
+            "METADATA_NAMES": self.metadataNamesEdit.text(),
+            "TABLE_SORT": self.tableSortEdit.text(),
             "FADE_DURATION": self.fadeDurationEdit.text(),
-            "FADE_OPACITY": self.fadeOpacityEdit.text()
+            "FADE_OPACITY": self.fadeOpacityEdit.text(),
+            "MEDIA_CACHE_MB": self.mediaCacheEdit.text(),
+            "WARM_CACHE_TABLES": self.warmCacheEdit.text(),
+            "BOOT_SNAPSHOT": self.bootSnapshotEdit.text(),
+            "IDLE_TIERS": self.idleTiersEdit.text(),
+            "ATTRACT_MODE_INTERVAL": self.attractIntervalEdit.text(),
+            "FRAME_CACHE": self.frameCacheEdit.text(),
+            "FRAME_CACHE_MB": self.frameCacheSizeEdit.text(),
+            "METADATA_WORKERS": self.metadataWorkersEdit.text(),
+            "READAHEAD_DELAY": self.readaheadDelayEdit.text(),
+            "READAHEAD_MB": self.readaheadSizeEdit.text(),
+            "SOUND_VOLUME": self.soundVolumeEdit.text(),
+            "SOUND_POLYPHONY": self.soundPolyphonyEdit.text(),
+            "SOUND_REPEAT_INTERVAL": self.soundRepeatEdit.text(),
+            "TABLE_PREVIEW": self.tablePreviewEdit.text(),
+            "PREVIEW_VOLUME": self.previewVolumeEdit.text(),
+            "PREVIEW_DELAY": self.previewDelayEdit.text()
         }
 
     def add_section_title(self, title):
@@ -361,13 +571,27 @@ class SettingsDialog(QDialog):
     def validate_settings(self, values):
         """Validate critical settings."""
         errors = []
-        root_folder = values["VPX_ROOT_FOLDER"]
-        if not os.path.isdir(root_folder):
-            errors.append(f"VPX_ROOT_FOLDER '{root_folder}' is not a valid directory.")
-        else:
-            has_vpx = any(file.lower().endswith(".vpx") for root, _, files in os.walk(root_folder) for file in files)
-            if not has_vpx:
-                errors.append(f"No .vpx files found in VPX_ROOT_FOLDER '{root_folder}'.")
+        try:
+            timeout = int(values["ROOT_SCAN_TIMEOUT"])
+        except ValueError:
+            errors.append(f"ROOT_SCAN_TIMEOUT '{values['ROOT_SCAN_TIMEOUT']}' must be a number of seconds.")
+            timeout = ROOT_SCAN_TIMEOUT
+        roots = library_roots(values["VPX_ROOT_FOLDER"])
+        if not roots:
+            errors.append("VPX_ROOT_FOLDER is empty.")
+        # Probe all folders at once, on their scan workers, so a hung mount only costs the timeout
+        probes = self.library.probe(roots, timeout)
+        for root, probe in probes.items():
+            if probe == "missing":
+                errors.append(f"VPX_ROOT_FOLDER '{root}' is not a valid directory.")
+        if roots and "tables" not in probes.values() and "timeout" not in probes.values():
+            errors.append(f"No .vpx files found in VPX_ROOT_FOLDER '{values['VPX_ROOT_FOLDER']}'.")
+        try:
+            parse_idle_tiers(values["IDLE_TIERS"])
+        except ValueError:
+            errors.append(f"IDLE_TIERS '{values['IDLE_TIERS']}' must look like '120:50,600:20,1800:0'.")
+        if values["TABLE_SORT"].strip().lower() not in TABLE_SORT_MODES:
+            errors.append(f"TABLE_SORT '{values['TABLE_SORT']}' must be one of: {', '.join(TABLE_SORT_MODES)}.")
         executable = values["VPX_EXECUTABLE"]
         if not os.path.isfile(executable):
             errors.append(f"VPX_EXECUTABLE '{executable}' is not a valid file.")
@@ -375,6 +599,208 @@ class SettingsDialog(QDialog):
             errors.append(f"VPX_EXECUTABLE '{executable}' is not executable.")
         return errors
 
+# ### Table Catalogue
+
+_DIGITS = re.compile(r"(\d+)")
+
+def fold_text(text):
+    """Case- and accent-insensitive form of text ("Élan" -> "elan")."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+def natural_sort_key(text):
+    """Sort key that orders "Table 9" before "Table 10" and ignores case and accents."""
+    parts = _DIGITS.split(fold_text(text))
+    parts[1::2] = [int(number) for number in parts[1::2]]
+    return tuple(parts)
+
+_YEAR = re.compile(r"\b(19[5-9]\d|20\d\d)\b")
+
+TABLE_SORT_MODES = ("name", "author", "year", "file")
+
+class TableRecord:
+    """One table of the library. Slots keep 20k+ entries small."""
+
+    __slots__ = ("table_name", "display_name", "vpx_file", "folder", "table_img",
+                 "wheel_img", "backglass_img", "dmd_img", "author", "version",
+                 "release", "sort_key", "search_key", "offline")
+
+    def __init__(self, table_name, vpx_file, folder, table_img, wheel_img, backglass_img, dmd_img):
+        self.table_name = table_name
+        self.display_name = table_name
+        self.vpx_file = vpx_file
+        self.folder = folder
+        self.table_img = table_img
+        self.wheel_img = wheel_img
+        self.backglass_img = backglass_img
+        self.dmd_img = dmd_img
+        self.author = self.version = self.release = ""
+        self.offline = False  # its folder hasn't answered: show defaults, touch nothing on disk
+        self._update_keys()
+
+    def set_metadata(self, entry):
+        """Apply a TableInfo entry from MetadataCache (None leaves the record as scanned)."""
+        if not entry:
+            return
+        if METADATA_NAMES and entry.get("name"):
+            self.display_name = entry["name"]
+        self.author = entry.get("author", "")
+        self.version = entry.get("version", "")
+        self.release = entry.get("release", "")
+        screenshot = entry.get("screenshot")
+        if self.table_img == DEFAULT_TABLE_IMAGE and screenshot and os.path.exists(screenshot):
+            self.table_img = screenshot
+        self._update_keys()
+
+    def _update_keys(self):
+        name_key = natural_sort_key(self.display_name)
+        if TABLE_SORT == "author":
+            self.sort_key = (not self.author, natural_sort_key(self.author), name_key)
+        elif TABLE_SORT == "year":
+            year = _YEAR.search(self.release) or _YEAR.search(self.table_name)
+            self.sort_key = (int(year.group(1)) if year else 9999, name_key)
+        elif TABLE_SORT == "file":
+            self.sort_key = natural_sort_key(self.table_name)
+        else:
+            self.sort_key = name_key
+        self.search_key = fold_text("\n".join((self.display_name, self.table_name, self.author)))
+
+class TableCatalogue:
+    """Sorted, index-addressable table library used by the viewer."""
+
+    def __init__(self, records=()):
+        self._records = sorted(records, key=lambda r: (r.sort_key, r.table_name, r.vpx_file))
+        self._index_by_file = None
+
+    def __len__(self):
+        return len(self._records)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def index_of(self, vpx_file):
+        """Return the index of a table by its .vpx path, or -1."""
+        if self._index_by_file is None:
+            self._index_by_file = {r.vpx_file: i for i, r in enumerate(self._records)}
+        return self._index_by_file.get(vpx_file, -1)
+
+    def find(self, query, start=0):
+        """Return the index of the first table whose name contains query, or -1."""
+        query = fold_text(query)
+        count = len(self._records)
+        for offset in range(count):
+            index = (start + offset) % count
+            if query in self._records[index].search_key:
+                return index
+        return -1
+
+# ### VPX Metadata
+
+class MetadataCache(QObject):
+    """TableInfo metadata of every .vpx, cached in METADATA_FILE by size and mtime.
+
+    get() only looks at the cache, so scanning stays as fast as before.
+    refresh() stats the catalogue on a background thread, extracts new or
+    changed tables in a process pool and emits updated when entries changed.
+    """
+
+    SAVE_EVERY = 500
+
+    updated = pyqtSignal()
+
+    def __init__(self, path=METADATA_FILE):
+        super().__init__()
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pending = None  # the latest refresh() request not yet picked up by the worker
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def get(self, vpx_file):
+        with self._lock:
+            return self.entries.get(vpx_file)
+
+    def _save(self):
+        with self._lock:
+            data = json.dumps(self.entries)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + ".tmp", "w") as f:
+            f.write(data)
+        os.replace(self.path + ".tmp", self.path)
+
+    def refresh(self, catalogue):
+        """Extract metadata for new or changed tables of catalogue in the background.
+
+        A request made while a pass is running is kept (only the latest one)
+        and handled as soon as that pass finishes.
+        """
+        vpx_files = [table.vpx_file for table in catalogue if not table.offline]
+        with self._lock:
+            self._pending = vpx_files
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._refresh_worker, name="vpx-metadata", daemon=True)
+            self._thread.start()
+
+    def _refresh_worker(self):
+        while True:
+            with self._lock:
+                vpx_files, self._pending = self._pending, None
+                if vpx_files is None:
+                    self._thread = None
+                    return
+            try:
+                self._refresh(vpx_files)
+            except Exception as e:
+                print(f"Error extracting table metadata: {e}")
+
+    def _refresh(self, vpx_files):
+        stale = []
+        for vpx_file in vpx_files:
+            try:
+                stat = os.stat(vpx_file)
+            except OSError:
+                continue
+            entry = self.get(vpx_file)
+            if not entry or entry.get("size") != stat.st_size or entry.get("mtime") != stat.st_mtime:
+                stale.append(vpx_file)
+        if not stale:
+            return
+        started = time.monotonic()
+        workers = METADATA_WORKERS or os.cpu_count() or 1
+        done = 0
+        try:
+            # spawn, not fork: this process runs Qt and cache threads that a fork would copy mid-flight
+            with ProcessPoolExecutor(max_workers=min(workers, len(stale)),
+                                     mp_context=multiprocessing.get_context("spawn")) as pool:
+                futures = {pool.submit(extract_vpx_metadata, vpx_file, SCREENSHOT_DIR): vpx_file
+                           for vpx_file in stale}
+                for future in as_completed(futures):
+                    try:
+                        entry = future.result()
+                    except Exception as e:
+                        print(f"Error reading table info from {futures[future]}: {e}")
+                        continue
+                    with self._lock:
+                        self.entries[futures[future]] = entry
+                    done += 1
+                    if done % self.SAVE_EVERY == 0:
+                        self._save()
+        except Exception as e:
+            print(f"Error extracting table metadata: {e}")
+        if done:
+            self._save()
+            print(f"Read table info of {done} tables in {time.monotonic() - started:.1f} s")
+            self.updated.emit()
+
 # ### Table Data Loader
 
 def get_image_path(root, preferred_media_path, fallback_media_path, default_media_path):
@@ -387,25 +813,1403 @@ def get_image_path(root, preferred_media_path, fallback_media_path, default_medi
         return fallback_path
     return default_media_path
 
-def load_table_list():
-    """Load and sort table data from VPX_ROOT_FOLDER."""
-    tables = []
-    for root, _, files in os.walk(VPX_ROOT_FOLDER):
+def library_roots(text=None):
+    """The table folders listed in VPX_ROOT_FOLDER (or text), separated by os.pathsep."""
+    roots = []
+    for root in (VPX_ROOT_FOLDER if text is None else text).split(os.pathsep):
+        root = os.path.expanduser(root.strip())
+        if root and root not in roots:
+            roots.append(root)
+    return roots
+
+def scan_root(root):
+    """Walk one library folder and return a [vpx_file, table_img, wheel_img,
+    backglass_img, dmd_img] row per table. Raises OSError if it is not a directory."""
+    if not os.path.isdir(root):
+        raise OSError(f"'{root}' is not a valid directory")
+    rows = []
+    for folder, _, files in os.walk(root):
         for file in files:
             if file.lower().endswith(".vpx"):
-                table_name = os.path.splitext(file)[0]
-                vpx_path = os.path.join(root, file)
-                tables.append({
-                    "table_name": table_name,
-                    "vpx_file": vpx_path,
-                    "folder": root,
-                    "table_img": get_image_path(root, CUSTOM_TABLE_VIDEO, CUSTOM_TABLE_IMAGE, DEFAULT_TABLE_IMAGE),
-                    "wheel_img": get_image_path(root, CUSTOM_WHEEL_IMAGE, CUSTOM_WHEEL_IMAGE, DEFAULT_WHEEL_IMAGE),
-                    "backglass_img": get_image_path(root, CUSTOM_BACKGLASS_VIDEO, CUSTOM_BACKGLASS_IMAGE, DEFAULT_BACKGLASS_IMAGE),
-                    "dmd_img": get_image_path(root, CUSTOM_DMD_VIDEO, CUSTOM_MARQUEE_IMAGE, DEFAULT_DMD_VIDEO)
-                })
-    tables.sort(key=lambda x: x["table_name"])
-    return tables
+                rows.append([
+                    os.path.join(folder, file),
+                    get_image_path(folder, CUSTOM_TABLE_VIDEO, CUSTOM_TABLE_IMAGE, DEFAULT_TABLE_IMAGE),
+                    get_image_path(folder, CUSTOM_WHEEL_IMAGE, CUSTOM_WHEEL_IMAGE, DEFAULT_WHEEL_IMAGE),
+                    get_image_path(folder, CUSTOM_BACKGLASS_VIDEO, CUSTOM_BACKGLASS_IMAGE, DEFAULT_BACKGLASS_IMAGE),
+                    get_image_path(folder, CUSTOM_DMD_VIDEO, CUSTOM_MARQUEE_IMAGE, DEFAULT_DMD_VIDEO)
+                ])
+    return rows
+
+def table_media(table):
+    """The files shown for table (None for no table), to tell whether a rescan changed them."""
+    if table is None:
+        return None
+    return table.vpx_file, table.table_img, table.backglass_img, table.dmd_img
+
+def make_table_record(row, metadata=None, offline=False):
+    """Build a TableRecord from a scan_root() row, applying cached TableInfo metadata if given.
+
+    Records of an offline folder get the default media (the wheel path is kept
+    for the atlas, which draws it from memory), so showing them never stats
+    a mount that may hang.
+    """
+    vpx_file, table_img, wheel_img, backglass_img, dmd_img = row
+    if offline:
+        table_img, backglass_img, dmd_img = DEFAULT_TABLE_IMAGE, DEFAULT_BACKGLASS_IMAGE, DEFAULT_DMD_VIDEO
+    folder = sys.intern(os.path.dirname(vpx_file))
+    table = TableRecord(
+        table_name=os.path.splitext(os.path.basename(vpx_file))[0],
+        vpx_file=vpx_file,
+        folder=folder,
+        table_img=table_img,
+        wheel_img=wheel_img,
+        backglass_img=backglass_img,
+        dmd_img=dmd_img
+    )
+    table.offline = offline
+    if metadata:
+        table.set_metadata(metadata.get(vpx_file))
+    return table
+
+class LibraryScanner(QObject):
+    """Scans every library folder on its own worker thread.
+
+    Each folder's last complete scan is kept as an index in LIBRARY_INDEX_DIR
+    and stands in for it until the fresh scan finishes. A folder that errors,
+    or does not finish within ROOT_SCAN_TIMEOUT (a hung NFS/SMB mount), is
+    marked stale and keeps its last known tables; if its worker ever returns,
+    the folder becomes fresh again. Tables of folders that are not fresh are
+    catalogued as offline. changed is emitted whenever the contents or states
+    change.
+    """
+
+    SCANNING, FRESH, STALE = "scanning", "fresh", "stale"
+
+    changed = pyqtSignal()
+
+    def __init__(self, folder=LIBRARY_INDEX_DIR):
+        super().__init__()
+        self.folder = folder
+        self.roots = []
+        self.rows = {}  # root -> rows of the fresh scan or cached index
+        self.state = {}  # root -> SCANNING, FRESH or STALE
+        self._threads = {}
+        self._lock = threading.Lock()
+        self.timeout_timer = QTimer(self)
+        self.timeout_timer.setSingleShot(True)
+        self.timeout_timer.timeout.connect(self._time_out)
+
+    def _index_path(self, root):
+        return os.path.join(self.folder, hashlib.sha1(root.encode("utf-8", "surrogateescape")).hexdigest() + ".json")
+
+    def _load_index(self, root):
+        try:
+            with open(self._index_path(root)) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return []
+        return index.get("tables", []) if index.get("root") == root else []
+
+    def _save_index(self, root, rows):
+        os.makedirs(self.folder, exist_ok=True)
+        path = self._index_path(root)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"root": root, "scanned": time.time(), "tables": rows}, f)
+        os.replace(path + ".tmp", path)
+
+    def scan(self):
+        """Rescan every library folder in the background."""
+        self.roots = library_roots()
+        with self._lock:
+            for root in self.roots:
+                if root not in self.rows:
+                    self.rows[root] = self._load_index(root)
+                self._start_scan(root)
+        self.timeout_timer.start(ROOT_SCAN_TIMEOUT * 1000)
+
+    def probe(self, roots, timeout):
+        """Check library folders on their scan workers, waiting at most timeout seconds.
+
+        Returns {root: "tables" | "empty" | "missing" | "timeout"}. The folders
+        are rescanned as a side effect, and one stuck on a hung mount reports
+        "timeout" without getting a second worker.
+        """
+        with self._lock:
+            threads = {root: self._start_scan(root) for root in roots}
+        deadline = time.monotonic() + timeout
+        for thread in threads.values():
+            thread.join(max(0.0, deadline - time.monotonic()))
+        results = {}
+        with self._lock:
+            for root, thread in threads.items():
+                if thread.is_alive():
+                    self.state[root] = self.STALE
+                    results[root] = "timeout"
+                elif self.state.get(root) == self.STALE:
+                    results[root] = "missing"
+                else:
+                    results[root] = "tables" if self.rows.get(root) else "empty"
+        return results
+
+    def _start_scan(self, root):
+        """Start root's worker and return it; the caller holds _lock."""
+        thread = self._threads.get(root)
+        if thread and thread.is_alive():
+            return thread  # still stuck on a hung mount; one worker per folder is enough
+        self.state[root] = self.SCANNING
+        thread = threading.Thread(target=self._scan, args=(root,), name=f"scan {root}", daemon=True)
+        self._threads[root] = thread
+        thread.start()
+        return thread
+
+    def _scan(self, root):
+        started = time.monotonic()
+        try:
+            rows = scan_root(root)
+        except OSError as e:
+            print(f"Error scanning {root}: {e}")
+            with self._lock:
+                self.state[root] = self.STALE
+        else:
+            with self._lock:
+                self.rows[root] = rows
+                self.state[root] = self.FRESH
+            try:
+                self._save_index(root, rows)
+            except OSError as e:
+                print(f"Error saving library index for {root}: {e}")
+            elapsed = time.monotonic() - started
+            if elapsed > ROOT_SCAN_TIMEOUT:
+                print(f"{root} answered after {elapsed:.1f} s, its tables are up to date again")
+        self.changed.emit()
+
+    def _time_out(self):
+        with self._lock:
+            late = [root for root in self.roots if self.state.get(root) == self.SCANNING]
+            for root in late:
+                self.state[root] = self.STALE
+        for root in late:
+            print(f"{root} did not answer within {ROOT_SCAN_TIMEOUT} s, showing its last known tables")
+        if late:
+            self.changed.emit()
+
+    def settled(self):
+        """True once every folder has finished scanning or timed out."""
+        with self._lock:
+            return all(self.state.get(root) != self.SCANNING for root in self.roots)
+
+    def stale_roots(self):
+        with self._lock:
+            return [root for root in self.roots if self.state.get(root) == self.STALE]
+
+    def catalogue(self, metadata=None):
+        """Return a TableCatalogue of the current contents of all folders."""
+        with self._lock:
+            rows = [(row, self.state.get(root) != self.FRESH) for root in self.roots for row in self.rows.get(root, ())]
+        return TableCatalogue(make_table_record(row, metadata, offline) for row, offline in rows)
+
+# ### DMD Frame Store
+
+class DmdFrameStore:
+    """DMD animation held as native-resolution 8-bit indexed frames.
+
+    A 128x32 frame costs 4 KB here instead of ~1 MB as a scaled RGBA pixmap.
+    Identical color tables are shared between frames.
+    """
+
+    __slots__ = ("width", "height", "frames", "delays", "palettes", "frame_palettes")
+
+    MAX_SCALE = 2  # sources up to twice the native grid (HD DMD captures) still qualify
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.frames = []          # bytes, width * height palette indices per frame
+        self.delays = []          # milliseconds per frame
+        self.palettes = []        # shared color tables (lists of QRgb)
+        self.frame_palettes = []  # index into self.palettes per frame
+
+    @classmethod
+    def fits(cls, path, native_width, native_height):
+        """True if path is a GIF small enough to be a dot grid of the given size.
+
+        Only the header is read. Larger, full-color clips are left to QMovie,
+        as downscaling and indexing every frame of those is slow and lossy.
+        """
+        if not path.lower().endswith('.gif'):
+            return False
+        size = QImageReader(path).size()
+        return (size.isValid() and size.width() <= native_width * cls.MAX_SCALE
+                and size.height() <= native_height * cls.MAX_SCALE)
+
+    @classmethod
+    def from_file(cls, path, native_width, native_height):
+        """Decode an animation down to its dot grid, or return None if unreadable."""
+        reader = QImageReader(path)
+        store = None
+        palette_ids = {}
+        while True:
+            image = reader.read()
+            if image.isNull():
+                break
+            delay = reader.nextImageDelay()
+            if image.width() > native_width or image.height() > native_height:
+                image = image.scaled(native_width, native_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            image = image.convertToFormat(QImage.Format_Indexed8, Qt.ThresholdDither | Qt.AvoidDither)
+            if store is None:
+                store = cls(image.width(), image.height())
+            elif image.size() != QSize(store.width, store.height):
+                image = image.scaled(store.width, store.height).convertToFormat(QImage.Format_Indexed8, Qt.ThresholdDither | Qt.AvoidDither)
+            store._append(image, delay if delay > 0 else 100, palette_ids)
+        if store is None or not store.frames:
+            return None
+        return store
+
+    def _append(self, image, delay, palette_ids):
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        stride = image.bytesPerLine()
+        raw = bits.asstring()
+        if stride != self.width:
+            raw = b"".join(raw[y * stride:y * stride + self.width] for y in range(self.height))
+        color_table = tuple(image.colorTable())
+        if color_table not in palette_ids:
+            palette_ids[color_table] = len(self.palettes)
+            self.palettes.append(list(color_table))
+        self.frames.append(raw)
+        self.delays.append(delay)
+        self.frame_palettes.append(palette_ids[color_table])
+
+    def __len__(self):
+        return len(self.frames)
+
+    def frame_image(self, index):
+        """Return a QImage viewing the stored indices of one frame (no pixel copy)."""
+        image = QImage(self.frames[index], self.width, self.height, self.width, QImage.Format_Indexed8)
+        image.setColorTable(self.palettes[self.frame_palettes[index]])
+        return image
+
+class DmdDisplay(QWidget):
+    """Paints a DmdFrameStore enlarged to the widget as a dot matrix."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.store = None
+        self.frame_index = 0
+        self.speed = 100
+        self._mask = None
+        self._mask_key = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._next_frame)
+
+    def set_store(self, store):
+        """Show a new animation from its first frame."""
+        self.timer.stop()
+        self.store = store
+        self.frame_index = 0
+        self.update()
+        self._schedule()
+
+    def stop(self):
+        self.timer.stop()
+        self.store = None
+
+    def set_speed(self, percent):
+        """Play at percent of the recorded frame rate; 0 freezes the current frame."""
+        self.speed = percent
+        if percent <= 0:
+            self.timer.stop()
+        elif not self.timer.isActive():
+            self._schedule()
+
+    def _schedule(self):
+        if self.store and len(self.store) > 1 and self.speed > 0:
+            self.timer.start(self.store.delays[self.frame_index] * 100 // self.speed)
+
+    def _next_frame(self):
+        self.frame_index = (self.frame_index + 1) % len(self.store)
+        self._schedule()
+        self.update(self._dot_rect())
+
+    def _dot_rect(self):
+        """Largest rect with a whole-pixel dot pitch, centered in the widget."""
+        if not self.store:
+            return self.rect()
+        pitch = max(1, min(self.width() // self.store.width, self.height() // self.store.height))
+        width, height = pitch * self.store.width, pitch * self.store.height
+        return QRect((self.width() - width) // 2, (self.height() - height) // 2, width, height)
+
+    def _dot_mask(self, rect):
+        """Black overlay with a round hole per dot, rebuilt only when the geometry changes."""
+        key = (rect.width(), rect.height(), self.store.width, self.store.height)
+        if self._mask_key != key:
+            pitch = rect.width() / self.store.width
+            dot = pitch * 0.85
+            offset = (pitch - dot) / 2
+            mask = QImage(rect.size(), QImage.Format_ARGB32_Premultiplied)
+            mask.fill(Qt.black)
+            painter = QPainter(mask)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setCompositionMode(QPainter.CompositionMode_Clear)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(Qt.black)
+            for y in range(self.store.height):
+                for x in range(self.store.width):
+                    painter.drawEllipse(QRectF(x * pitch + offset, y * pitch + offset, dot, dot))
+            painter.end()
+            self._mask, self._mask_key = QPixmap.fromImage(mask), key
+        return self._mask
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.black)
+        if self.store:
+            rect = self._dot_rect()
+            painter.drawImage(rect, self.store.frame_image(self.frame_index))
+            painter.drawPixmap(rect.topLeft(), self._dot_mask(rect))
+        painter.end()
+
+# ### Play Statistics
+
+class PlayStats:
+    """Persistent launches, dwell time and last position per table (keyed by .vpx path)."""
+
+    MAX_DWELL = 600  # seconds; longer visits are someone walking away, not interest
+
+    def __init__(self, path=STATS_FILE):
+        self.path = path
+        self.tables = {}
+        self.last_position = None
+        self._viewing = None
+        self._viewing_since = 0.0
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            self.tables = data.get("tables", {})
+            self.last_position = data.get("last_position")
+        except (OSError, ValueError):
+            pass
+
+    def _entry(self, vpx_file):
+        return self.tables.setdefault(vpx_file, {"launches": 0, "dwell": 0.0, "last_viewed": 0})
+
+    def viewed(self, vpx_file, counted=True):
+        """Close the dwell period of the previous table and start one for vpx_file.
+
+        Uncounted views (attract mode) leave the statistics and the last
+        position alone, so the boot snapshot and resume point still match.
+        """
+        now = time.monotonic()
+        if self._viewing:
+            entry = self._entry(self._viewing)
+            entry["dwell"] = round(entry["dwell"] + min(now - self._viewing_since, self.MAX_DWELL), 1)
+        self._viewing, self._viewing_since = vpx_file if counted else None, now
+        if vpx_file and counted:
+            self._entry(vpx_file)["last_viewed"] = int(time.time())
+            self.last_position = vpx_file
+
+    def launched(self, vpx_file):
+        self._entry(vpx_file)["launches"] += 1
+
+    def ranked(self, limit):
+        """Most-launched tables first, then the most recently viewed ones."""
+        by_launches = sorted((f for f, e in self.tables.items() if e["launches"]),
+                             key=lambda f: (-self.tables[f]["launches"], -self.tables[f]["dwell"]))
+        by_recency = sorted(self.tables, key=lambda f: -self.tables[f]["last_viewed"])
+        ranked = list(dict.fromkeys(by_launches + by_recency))
+        return ranked[:limit]
+
+    def save(self):
+        self.viewed(self._viewing)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path + ".tmp", "w") as f:
+                json.dump({"last_position": self.last_position, "tables": self.tables}, f)
+            os.replace(self.path + ".tmp", self.path)
+        except OSError as e:
+            print(f"Error saving play statistics: {e}")
+
+# ### Media Cache
+
+class MediaCache:
+    """Memory-bounded LRU of decoded, pre-scaled media shared by both windows.
+
+    Misses decode on the calling thread; prefetch() and warm() decode on a
+    background thread (QImage is thread-safe, QPixmap is not) so the GUI
+    thread only has to wrap hits in a QPixmap.
+    """
+
+    PREFETCH, WARM = 0, 1  # queue priorities
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._queue = queue.PriorityQueue()
+        self._queued = set()
+        self._seq = itertools.count()
+        self._thread = None  # started on first use, so importing this module spawns nothing
+
+    # Loaders, safe to run on any thread
+
+    @staticmethod
+    def _load_scaled(path, width, height, mode):
+        image = QImage(path)
+        if image.isNull():
+            image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+            image.fill(Qt.black if mode == Qt.KeepAspectRatioByExpanding else Qt.transparent)
+            return image
+        return image.scaled(width, height, mode, Qt.SmoothTransformation)
+
+    @staticmethod
+    def _cost(value):
+        if isinstance(value, QImage):
+            return value.sizeInBytes()
+        if isinstance(value, DmdFrameStore):
+            return sum(map(len, value.frames))
+        return 0
+
+    def _get(self, key, load):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        value = load()
+        self._put(key, value)
+        return value
+
+    def _put(self, key, value):
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = value
+            self._size += self._cost(value)
+            budget = MEDIA_CACHE_MB * 1024 * 1024
+            while self._size > budget and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= self._cost(evicted)
+
+    def scaled_image(self, path, width, height, mode=Qt.KeepAspectRatio):
+        key = ("image", path, width, height, int(mode))
+        return self._get(key, lambda: self._load_scaled(path, width, height, mode))
+
+    def pixmap(self, path, width, height, mode=Qt.KeepAspectRatio):
+        return QPixmap.fromImage(self.scaled_image(path, width, height, mode))
+
+    def dmd_store(self, path):
+        key = ("dmd", path, DMD_NATIVE_WIDTH, DMD_NATIVE_HEIGHT)
+        return self._get(key, lambda: DmdFrameStore.from_file(path, DMD_NATIVE_WIDTH, DMD_NATIVE_HEIGHT))
+
+    # Background decoding
+
+    @staticmethod
+    def table_requests(table):
+        """The (method, args) pairs the viewer will ask for when showing table."""
+        wheel_img = DEFAULT_WHEEL_IMAGE if table.offline else table.wheel_img
+        requests = [("scaled_image", (wheel_img, WHEEL_IMAGE_SIZE, WHEEL_IMAGE_SIZE, Qt.KeepAspectRatio))]
+        if not table.table_img.lower().endswith('.gif'):
+            requests.append(("scaled_image", (table.table_img, MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT,
+                                              Qt.KeepAspectRatioByExpanding)))
+        if not table.backglass_img.lower().endswith('.gif'):
+            requests.append(("scaled_image", (table.backglass_img, BACKGLASS_IMAGE_WIDTH, BACKGLASS_IMAGE_HEIGHT,
+                                              Qt.KeepAspectRatio)))
+        if DMD_DOT_MATRIX and DmdFrameStore.fits(table.dmd_img, DMD_NATIVE_WIDTH, DMD_NATIVE_HEIGHT):
+            requests.append(("dmd_store", (table.dmd_img,)))
+        return requests
+
+    def _enqueue(self, tables, priority):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="media-cache", daemon=True)
+            self._thread.start()
+        for table in tables:
+            for request in self.table_requests(table):
+                if request not in self._queued:
+                    self._queued.add(request)
+                    self._queue.put((priority, next(self._seq), request))
+
+    def prefetch(self, tables):
+        """Decode media for tables about to be shown, ahead of any warm-up work."""
+        self._enqueue(tables, self.PREFETCH)
+
+    def warm(self, tables):
+        """Decode media for likely-to-be-visited tables when nothing else is queued."""
+        self._enqueue(tables, self.WARM)
+
+    def _worker(self):
+        while True:
+            _, _, request = self._queue.get()
+            method, args = request
+            try:
+                getattr(self, method)(*args)
+            except Exception as e:
+                print(f"Error pre-loading {args[0]}: {e}")
+            self._queued.discard(request)
+
+media_cache = MediaCache()
+
+# ### Frame Cache
+
+def fit_size(width, height, max_width, max_height):
+    """Largest (width, height) with the same aspect ratio that fits the box."""
+    aspect_ratio = width / height
+    return min(max_width, int(max_height * aspect_ratio)), min(max_height, int(max_width / aspect_ratio))
+
+class MappedMovie(QObject):
+    """Plays a FrameCache file by wrapping QImages around its memory map.
+
+    Mirrors the part of the QMovie API the viewer uses (start, stop,
+    setPaused, setSpeed) and emits every frame through frameChanged.
+    """
+
+    frameChanged = pyqtSignal(QImage)
+
+    def __init__(self, path):
+        super().__init__()
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.width, self.height, self.stride, self.count = FrameCache.HEADER.unpack_from(self._map)
+        self.frame_bytes = self.stride * self.height
+        delays_at = FrameCache.HEADER.size + self.count * self.frame_bytes
+        if magic != FrameCache.MAGIC or len(self._map) < delays_at + 4 * self.count or not self.count:
+            self._map.close()
+            raise ValueError(f"{path} is not a complete frame cache file")
+        self.delays = struct.unpack_from(f"<{self.count}I", self._map, delays_at)
+        self._base = int(sip.voidptr(self._map))
+        self.index = 0
+        self.speed = 100
+        self.paused = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._next_frame)
+
+    def frame(self, index):
+        """QImage over the mapped bytes of one frame; no decode, no copy."""
+        address = self._base + FrameCache.HEADER.size + index * self.frame_bytes
+        return QImage(sip.voidptr(address), self.width, self.height, self.stride,
+                      QImage.Format_ARGB32_Premultiplied)
+
+    def start(self):
+        self.index = 0
+        self.frameChanged.emit(self.frame(0))
+        self._schedule()
+
+    def stop(self):
+        self.timer.stop()
+
+    def setPaused(self, paused):
+        self.paused = paused
+        if paused:
+            self.timer.stop()
+        elif not self.timer.isActive():
+            self._schedule()
+
+    def setSpeed(self, percent):
+        self.speed = percent
+
+    def _schedule(self):
+        if self.count > 1 and not self.paused and self.speed > 0:
+            self.timer.start(max(10, self.delays[self.index]) * 100 // self.speed)
+
+    def _next_frame(self):
+        self.index = (self.index + 1) % self.count
+        self.frameChanged.emit(self.frame(self.index))
+        self._schedule()
+
+class FrameCache:
+    """Animations decoded once, at display size, into raw frame files for mmap playback.
+
+    File layout: HEADER, frame_count frames of premultiplied ARGB32, then one
+    uint32 delay (ms) per frame. Files are named after the source path, size,
+    mtime and target size, so edits to a GIF invalidate its entry. Builds run
+    on a background thread; the oldest files go once FRAME_CACHE_MB is exceeded.
+    """
+
+    HEADER = struct.Struct("<4sIIII")  # magic, width, height, bytes per line, frame count
+    MAGIC = b"AFRM"
+
+    def __init__(self, folder=FRAME_CACHE_DIR):
+        self.folder = folder
+        self._queue = queue.Queue()
+        self._queued = set()
+        self._thread = None  # started on first request
+
+    def _target(self, path, max_width, max_height):
+        """Return (cache file, width, height) for showing path fitted in the box, or None."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        size = QImageReader(path).size()
+        if size.width() <= 0 or size.height() <= 0:
+            return None
+        width, height = fit_size(size.width(), size.height(), max_width, max_height)
+        key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{width}x{height}"
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest() + ".frames"
+        return os.path.join(self.folder, name), width, height
+
+    def open(self, path, max_width, max_height):
+        """Return a MappedMovie for path if it is cached; otherwise queue a build and return None."""
+        target = self._target(path, max_width, max_height)
+        if target is None:
+            return None
+        if os.path.exists(target[0]):
+            try:
+                movie = MappedMovie(target[0])
+                os.utime(target[0])  # mtime doubles as last-use time for eviction
+                return movie
+            except (OSError, ValueError, struct.error) as e:
+                print(f"Error opening frame cache for {path}: {e}")
+        self.request(path, max_width, max_height)
+        return None
+
+    def request(self, path, max_width, max_height):
+        """Queue a background build of path's frame file if one isn't already pending."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="frame-cache", daemon=True)
+            self._thread.start()
+        if (path, max_width, max_height) not in self._queued:
+            self._queued.add((path, max_width, max_height))
+            self._queue.put((path, max_width, max_height))
+
+    def _worker(self):
+        while True:
+            request = self._queue.get()
+            try:
+                target = self._target(*request)
+                if target and not os.path.exists(target[0]):
+                    self._build(request[0], *target)
+                    self._evict()
+            except Exception as e:
+                print(f"Error caching frames of {request[0]}: {e}")
+            self._queued.discard(request)
+
+    def _build(self, path, cache_path, width, height):
+        os.makedirs(self.folder, exist_ok=True)
+        reader = QImageReader(path)
+        delays = []
+        with open(cache_path + ".tmp", "wb") as f:
+            f.write(bytes(self.HEADER.size))
+            stride = width * 4
+            while True:
+                image = reader.read()
+                if image.isNull():
+                    break
+                delays.append(max(0, reader.nextImageDelay()) or 100)
+                image = image.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+                image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+                bits = image.constBits()
+                bits.setsize(image.sizeInBytes())
+                stride = image.bytesPerLine()
+                f.write(bits.asstring())
+            f.write(struct.pack(f"<{len(delays)}I", *delays))
+            f.seek(0)
+            f.write(self.HEADER.pack(self.MAGIC, width, height, stride, len(delays)))
+        if delays:
+            os.replace(cache_path + ".tmp", cache_path)
+        else:
+            os.remove(cache_path + ".tmp")
+
+    def _evict(self):
+        entries = []
+        for entry in os.scandir(self.folder):
+            if entry.name.endswith(".frames"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, file_path in sorted(entries):
+            if total <= FRAME_CACHE_MB * 1024 * 1024:
+                break
+            os.remove(file_path)
+            total -= size
+
+_frame_cache = None
+
+def get_frame_cache():
+    """Return the FrameCache, creating it on first use so it only exists with FRAME_CACHE on."""
+    global _frame_cache
+    if _frame_cache is None:
+        _frame_cache = FrameCache()
+    return _frame_cache
+
+# ### Raw Images
+
+RAW_IMAGE_HEADER = struct.Struct("<4sIII")  # magic, width, height, bytes per line
+
+def write_raw_image(image, path, magic):
+    """Write image uncompressed behind a small header; replaces path atomically."""
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            f.write(RAW_IMAGE_HEADER.pack(magic, image.width(), image.height(), image.bytesPerLine()))
+            f.write(bits.asstring())
+        os.replace(path + ".tmp", path)
+    except OSError as e:
+        print(f"Error writing {path}: {e}")
+
+def read_raw_image(path, magic, width, height, image_format):
+    """Read a write_raw_image file straight into a new QImage, or return None if it doesn't match."""
+    image = QImage(width, height, image_format)
+    try:
+        with open(path, "rb") as f:
+            file_magic, w, h, stride = RAW_IMAGE_HEADER.unpack(f.read(RAW_IMAGE_HEADER.size))
+            if file_magic != magic or (w, h, stride) != (width, height, image.bytesPerLine()):
+                return None
+            bits = image.bits()
+            bits.setsize(image.sizeInBytes())
+            if f.readinto(memoryview(bits)) != image.sizeInBytes():
+                return None
+    except (OSError, struct.error):
+        return None
+    return image
+
+# ### Boot Snapshot
+
+SNAPSHOT_MAGIC = b"ASNP"
+
+def save_snapshot(widget, path):
+    """Write what widget currently shows as uncompressed RGB32 for instant loading."""
+    write_raw_image(widget.grab().toImage().convertToFormat(QImage.Format_RGB32), path, SNAPSHOT_MAGIC)
+
+def load_snapshot(path, width, height):
+    """Return the saved snapshot as a QPixmap, or None if missing or for another window size."""
+    image = read_raw_image(path, SNAPSHOT_MAGIC, width, height, QImage.Format_RGB32)
+    return QPixmap.fromImage(image) if image is not None else None
+
+def make_snapshot_label(window, path):
+    """Cover window with its last saved snapshot until live media is ready."""
+    pixmap = load_snapshot(path, window.width(), window.height()) if BOOT_SNAPSHOT else None
+    if pixmap is None:
+        return None
+    label = QLabel(window)
+    label.setGeometry(0, 0, window.width(), window.height())
+    label.setPixmap(pixmap)
+    label.raise_()
+    return label
+
+# ### Wheel Atlas
+
+class WheelAtlas(QObject):
+    """Every distinct wheel image pre-scaled into raw sprite-sheet pages on disk.
+
+    A manifest maps each wheel path (and its mtime) to a slot; slot n lives
+    in page n // PAGE_CELLS. sync() brings the pages up to date with the
+    table catalogue on a background thread. lookup() is a dict hit plus a
+    small LRU of loaded pages; pages that aren't loaded yet are read by a
+    second background thread, which emits updated once they arrive. Pages
+    the carousel is showing are pinned, as slots follow the catalogue order of
+    the first sync and a re-sorted strip can span more than LOADED_PAGES.
+    """
+
+    PAGE_COLUMNS = 16
+    PAGE_CELLS = PAGE_COLUMNS * PAGE_COLUMNS
+    PAGE_MAGIC = b"AWHL"
+    LOADED_PAGES = 4
+
+    updated = pyqtSignal()
+
+    def __init__(self, folder=WHEEL_ATLAS_DIR):
+        super().__init__()
+        self.folder = folder
+        self.cell = WHEEL_CAROUSEL_SIZE
+        self.slots = {}  # wheel path -> [slot, mtime]
+        self._pages = OrderedDict()
+        self._lock = threading.Lock()
+        self._sync_thread = None
+        self._pending_paths = None  # the latest sync() request not yet picked up by the worker
+        self._load_thread = None
+        self._wanted_pages = []  # pages asked for by lookup() or focus(), nearest first
+        self._pinned = set()  # pages of the wheels on screen, never evicted
+        self._generation = 0  # bumped whenever loaded pages go stale, so in-flight reads are dropped
+        self._load_manifest()
+
+    def _manifest_path(self):
+        return os.path.join(self.folder, "manifest.json")
+
+    def _page_path(self, page):
+        return os.path.join(self.folder, f"page_{page:04d}.raw")
+
+    def _page_size(self):
+        return self.cell * self.PAGE_COLUMNS
+
+    def _load_manifest(self):
+        try:
+            with open(self._manifest_path()) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        if manifest.get("cell") == self.cell:
+            self.slots = manifest.get("slots", {})
+
+    def _save_manifest(self, slots):
+        os.makedirs(self.folder, exist_ok=True)
+        with open(self._manifest_path() + ".tmp", "w") as f:
+            json.dump({"cell": self.cell, "slots": slots}, f)
+        os.replace(self._manifest_path() + ".tmp", self._manifest_path())
+
+    def _read_page(self, page):
+        size = self._page_size()
+        return read_raw_image(self._page_path(page), self.PAGE_MAGIC, size, size,
+                              QImage.Format_ARGB32_Premultiplied)
+
+    def sync(self, catalogue):
+        """Render missing or changed wheels of catalogue in the background.
+
+        A request made while a pass is running is kept (only the latest one)
+        and handled as soon as that pass finishes.
+        """
+        wheel_paths = list(dict.fromkeys(table.wheel_img for table in catalogue if not table.offline))
+        with self._lock:
+            self._pending_paths = wheel_paths
+            if self._sync_thread is not None:
+                return
+            self._sync_thread = threading.Thread(target=self._sync_worker, name="wheel-atlas", daemon=True)
+            self._sync_thread.start()
+
+    def _sync_worker(self):
+        while True:
+            with self._lock:
+                wheel_paths, self._pending_paths = self._pending_paths, None
+                if wheel_paths is None:
+                    self._sync_thread = None
+                    return
+                if self.cell != WHEEL_CAROUSEL_SIZE:
+                    self.cell = WHEEL_CAROUSEL_SIZE
+                    self.slots = {}
+                    self._pages.clear()
+                    self._pinned.clear()
+                    self._generation += 1
+            try:
+                self._sync(wheel_paths)
+            except Exception as e:
+                print(f"Error building wheel atlas: {e}")
+
+    def _sync(self, wheel_paths):
+        with self._lock:
+            slots = {path: list(entry) for path, entry in self.slots.items()}
+        next_slot = max((slot for slot, _ in slots.values()), default=-1) + 1
+        pending = {}
+        page_exists = {}
+        for path in wheel_paths:
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            entry = slots.get(path)
+            if entry and entry[1] == mtime:
+                page = entry[0] // self.PAGE_CELLS
+                if page not in page_exists:
+                    page_exists[page] = os.path.exists(self._page_path(page))
+                if page_exists[page]:
+                    continue
+            if not entry:
+                entry = slots[path] = [next_slot, mtime]
+                next_slot += 1
+            entry[1] = mtime
+            pending.setdefault(entry[0] // self.PAGE_CELLS, []).append((entry[0], path))
+        if not pending:
+            return
+        size = self._page_size()
+        for page, cells in sorted(pending.items()):
+            image = self._read_page(page)
+            if image is None:
+                image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+                image.fill(Qt.transparent)
+            painter = QPainter(image)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            for slot, path in cells:
+                target = self._cell_rect(slot)
+                painter.setCompositionMode(QPainter.CompositionMode_Clear)
+                painter.fillRect(target, Qt.transparent)
+                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+                wheel = QImage(path)
+                if not wheel.isNull():
+                    wheel = wheel.scaled(self.cell, self.cell, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    painter.drawImage(target.x() + (self.cell - wheel.width()) // 2,
+                                      target.y() + (self.cell - wheel.height()) // 2, wheel)
+            painter.end()
+            write_raw_image(image, self._page_path(page), self.PAGE_MAGIC)
+            with self._lock:
+                self._pages.pop(page, None)
+                self._generation += 1
+                self.slots.update({path: slots[path] for _, path in cells})
+        try:
+            self._save_manifest(slots)
+        except OSError as e:
+            print(f"Error saving wheel atlas manifest: {e}")
+        self.updated.emit()
+
+    def _cell_rect(self, slot):
+        cell_index = slot % self.PAGE_CELLS
+        return QRect((cell_index % self.PAGE_COLUMNS) * self.cell,
+                     (cell_index // self.PAGE_COLUMNS) * self.cell, self.cell, self.cell)
+
+    def lookup(self, wheel_path):
+        """Return (page image, source rect) for a wheel, or None if it isn't in the atlas or loaded yet.
+
+        Never touches the disk: a missing page is queued for the loader thread.
+        """
+        with self._lock:
+            entry = self.slots.get(wheel_path)
+            if entry is None:
+                return None
+            page = entry[0] // self.PAGE_CELLS
+            self._pinned.add(page)
+            image = self._pages.get(page)
+            if image is None:
+                self._want(page)
+                return None
+            self._pages.move_to_end(page)
+            return image, self._cell_rect(entry[0])
+
+    def focus(self, visible_paths, nearby_paths):
+        """Pin the pages of visible_paths, unpinning the rest, and queue them followed
+        by those of nearby_paths (nearest first) so scrolling finds them loaded."""
+        with self._lock:
+            visible = [self.slots[path][0] // self.PAGE_CELLS for path in visible_paths if path in self.slots]
+            nearby = [self.slots[path][0] // self.PAGE_CELLS for path in nearby_paths if path in self.slots]
+            self._pinned = set(visible)
+            for page in visible + nearby:
+                self._want(page)
+
+    def _want(self, page):
+        """Queue page for loading; the caller holds _lock."""
+        if page in self._pages or page in self._wanted_pages:
+            return
+        self._wanted_pages.append(page)
+        if self._load_thread is None:
+            self._load_thread = threading.Thread(target=self._load_worker, name="wheel-pages", daemon=True)
+            self._load_thread.start()
+
+    def _load_worker(self):
+        while True:
+            with self._lock:
+                if not self._wanted_pages:
+                    self._load_thread = None
+                    return
+                page = self._wanted_pages.pop(0)
+                if page in self._pages:
+                    continue
+                generation = self._generation
+            image = self._read_page(page)
+            if image is None:
+                continue
+            with self._lock:
+                if generation != self._generation:
+                    continue
+                self._pages[page] = image
+                self._evict()
+            self.updated.emit()
+
+    def _evict(self):
+        """Drop the least recently used unpinned pages beyond LOADED_PAGES; the caller holds _lock."""
+        limit = max(self.LOADED_PAGES, len(self._pinned))
+        for page in list(self._pages):
+            if len(self._pages) <= limit:
+                break
+            if page not in self._pinned:
+                del self._pages[page]
+
+class WheelCarousel(QWidget):
+    """Strip of the previous and next WHEEL_CAROUSEL_COUNT wheels, drawn from a WheelAtlas."""
+
+    def __init__(self, atlas, parent=None):
+        super().__init__(parent)
+        self.atlas = atlas
+        self.catalogue = TableCatalogue()
+        self.index = 0
+        self.offset = 0.0
+        self.scroll = QVariantAnimation(self)
+        self.scroll.setEasingCurve(QEasingCurve.OutQuad)
+        self.scroll.valueChanged.connect(self._scrolled)
+        atlas.updated.connect(self.update)
+
+    def set_index(self, catalogue, index, direction=0):
+        """Center index, sliding in from direction (-1 left, 1 right, 0 no animation)."""
+        self.catalogue = catalogue
+        self.index = index
+        count = len(catalogue)
+        if count and WHEEL_CAROUSEL_COUNT:
+            shown = WHEEL_CAROUSEL_COUNT + 1  # one more each side is drawn while sliding
+            reach = 2 * WHEEL_CAROUSEL_COUNT + 1  # the visible strip plus one more strip each side
+            paths = [catalogue[(index + step) % count].wheel_img
+                     for step in sorted(range(-reach, reach + 1), key=abs)]
+            self.atlas.focus(paths[:2 * shown + 1], paths[2 * shown + 1:])
+        self.scroll.stop()
+        if direction and FADE_DURATION > 0:
+            self.scroll.setDuration(FADE_DURATION)
+            self.scroll.setStartValue(float(direction))
+            self.scroll.setEndValue(0.0)
+            self.scroll.start()
+        else:
+            self.offset = 0.0
+            self.update()
+
+    def _scrolled(self, value):
+        self.offset = value
+        self.update()
+
+    def paintEvent(self, event):
+        count = len(self.catalogue)
+        if not count or not WHEEL_CAROUSEL_COUNT:
+            return
+        cell = WHEEL_CAROUSEL_SIZE
+        spacing = self.width() / (2 * WHEEL_CAROUSEL_COUNT + 1)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        for step in range(-WHEEL_CAROUSEL_COUNT - 1, WHEEL_CAROUSEL_COUNT + 2):
+            position = step + self.offset
+            if abs(position) > WHEEL_CAROUSEL_COUNT + 0.5:
+                continue
+            sprite = self.atlas.lookup(self.catalogue[(self.index + step) % count].wheel_img)
+            if sprite is None:
+                continue
+            center_x = self.width() / 2 + position * spacing
+            painter.setOpacity(max(0.25, 1.0 - abs(position) / (WHEEL_CAROUSEL_COUNT + 1)))
+            painter.drawImage(QRectF(center_x - cell / 2, (self.height() - cell) / 2, cell, cell),
+                              sprite[0], QRectF(sprite[1]))
+        painter.end()
+
+# ### Idle Governor
+
+def parse_idle_tiers(text):
+    """Parse "120:50,600:0" into [(120, 50), (600, 0)]: idle seconds -> speed percent."""
+    tiers = []
+    for item in text.split(","):
+        if item.strip():
+            seconds, speed = item.split(":")
+            tiers.append((int(seconds), max(0, min(100, int(speed)))))
+    return sorted(tiers)
+
+class IdleGovernor(QObject):
+    """Steps animation speed down through IDLE_TIERS while nobody touches the cabinet.
+
+    Once the last tier is reached, ATTRACT_MODE_INTERVAL > 0 cycles through
+    tables. Any input restores full speed synchronously, before the event is
+    delivered. CPU time per tier is tracked to report what idling saved.
+    """
+
+    INPUT_EVENTS = (QEvent.KeyPress, QEvent.MouseButtonPress, QEvent.MouseMove, QEvent.Wheel)
+
+    def __init__(self, viewer):
+        super().__init__(viewer)
+        self.viewer = viewer
+        self.tiers = []
+        self.tier = 0  # 0 is full speed, n is self.tiers[n - 1]
+        self.load_tiers()
+        self.last_input = self.last_attract = time.monotonic()
+        self.cpu = {}  # tier -> [wall seconds, cpu seconds]
+        self._since = (time.monotonic(), time.process_time())
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._tick)
+        self.timer.start(1000)
+        QApplication.instance().installEventFilter(self)
+
+    @property
+    def speed(self):
+        return self.tiers[self.tier - 1][1] if self.tier else 100
+
+    def load_tiers(self):
+        """(Re)read IDLE_TIERS, falling back to the defaults if it can't be parsed."""
+        try:
+            tiers = parse_idle_tiers(IDLE_TIERS)
+        except ValueError as e:
+            print(f"Error parsing IDLE_TIERS '{IDLE_TIERS}', using '{DEFAULT_IDLE_TIERS}': {e}")
+            tiers = parse_idle_tiers(DEFAULT_IDLE_TIERS)
+        self.tiers = tiers
+        if self.tier > len(tiers):
+            self._set_tier(len(tiers))
+
+    def eventFilter(self, obj, event):
+        if event.type() in self.INPUT_EVENTS:
+            self.last_input = time.monotonic()
+            if self.tier:
+                self._set_tier(0)
+        return False
+
+    def _tick(self):
+        now = time.monotonic()
+        idle = now - self.last_input
+        tier = sum(1 for seconds, _ in self.tiers if idle >= seconds)
+        if tier != self.tier:
+            self._set_tier(tier)
+        if (ATTRACT_MODE_INTERVAL > 0 and self.tiers and tier == len(self.tiers)
+                and now - self.last_attract >= ATTRACT_MODE_INTERVAL):
+            self.last_attract = now
+            self.viewer.attract_step()
+
+    def pause(self):
+        """Stop stepping down while the GUI thread is blocked (a table is running)."""
+        self._account()
+        self.timer.stop()
+
+    def resume(self):
+        """Count the return from a pause as input; the paused time is not booked to any tier."""
+        now = time.monotonic()
+        self._since = (now, time.process_time())
+        self.last_input = self.last_attract = now
+        if self.tier:
+            self._set_tier(0)
+        self.timer.start(1000)
+
+    def _set_tier(self, tier):
+        self._account()
+        was_idle = self.tier > 0
+        self.tier = tier
+        self.viewer.set_animation_speed(self.speed)
+        if was_idle and not tier:
+            print(self.report())
+
+    def _account(self):
+        wall, cpu = time.monotonic(), time.process_time()
+        totals = self.cpu.setdefault(self.tier, [0.0, 0.0])
+        totals[0] += wall - self._since[0]
+        totals[1] += cpu - self._since[1]
+        self._since = (wall, cpu)
+
+    def cpu_saved(self):
+        """Return (estimated CPU seconds saved, idle wall seconds) so far.
+
+        The estimate assumes idle periods would have used CPU at the rate
+        measured while at full speed.
+        """
+        self._account()
+        active_wall, active_cpu = self.cpu.get(0, (0.0, 0.0))
+        idle_wall = sum(wall for tier, (wall, _) in self.cpu.items() if tier)
+        idle_cpu = sum(cpu for tier, (_, cpu) in self.cpu.items() if tier)
+        if active_wall <= 0:
+            return 0.0, idle_wall
+        return max(0.0, active_cpu / active_wall * idle_wall - idle_cpu), idle_wall
+
+    def report(self):
+        saved, idle_wall = self.cpu_saved()
+        return f"Idle governor: {idle_wall / 60:.1f} min idle, ~{saved:.1f} s of CPU time saved"
+
+# ### Sound Engine
+
+class SoundEngine(QObject):
+    """Preloaded navigation and launch effects plus a streamed per-table preview.
+
+    Each effect is decoded once into SOUND_POLYPHONY QSoundEffect voices, so
+    playing it never touches the disk. When every voice is busy the oldest is
+    restarted, and auto-repeated key presses are limited to one click every
+    SOUND_REPEAT_INTERVAL ms. Table previews go through QMediaPlayer, which
+    opens and decodes the file off the GUI thread, and only start once the
+    selection has rested for PREVIEW_DELAY ms.
+    """
+
+    EFFECTS = {"change": SND_TABLE_CHANGE, "load": SND_TABLE_LOAD}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.voices = {}  # name -> [QSoundEffect], least recently started first
+        self.last_played = {}
+        self.preview_player = QMediaPlayer(self, QMediaPlayer.StreamPlayback)
+        self.preview_path = None
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.timeout.connect(self._start_preview)
+        self.reload()
+
+    def reload(self):
+        """(Re)load the effects with the current volume and polyphony settings."""
+        for voices in self.voices.values():
+            for voice in voices:
+                voice.stop()
+                voice.deleteLater()
+        self.voices = {}
+        for name, path in self.EFFECTS.items():
+            if not os.path.exists(path):
+                continue
+            url = QUrl.fromLocalFile(os.path.abspath(path))
+            voices = []
+            for _ in range(max(1, SOUND_POLYPHONY)):
+                voice = QSoundEffect(self)
+                voice.setSource(url)
+                voice.setVolume(SOUND_VOLUME / 100)
+                voices.append(voice)
+            self.voices[name] = voices
+        self.preview_player.setVolume(PREVIEW_VOLUME)
+
+    def play(self, name, repeat=False):
+        """Play an effect; repeat=True marks an auto-repeated key press."""
+        voices = self.voices.get(name)
+        if not voices:
+            return
+        now = time.monotonic()
+        if repeat and now - self.last_played.get(name, 0.0) < SOUND_REPEAT_INTERVAL / 1000:
+            return
+        self.last_played[name] = now
+        voice = next((v for v in voices if not v.isPlaying()), voices[0])
+        voice.stop()
+        voices.remove(voice)
+        voices.append(voice)
+        voice.play()
+
+    def preview(self, folder):
+        """Queue the audio preview of the table in folder, replacing any current one."""
+        self.stop_preview()
+        path = os.path.join(folder, CUSTOM_TABLE_AUDIO)
+        if TABLE_PREVIEW and os.path.exists(path):
+            self.preview_path = path
+            self.preview_timer.start(PREVIEW_DELAY)
+
+    def _start_preview(self):
+        if self.preview_path:
+            self.preview_player.setMedia(QMediaContent(QUrl.fromLocalFile(os.path.abspath(self.preview_path))))
+            self.preview_player.play()
+
+    def stop_preview(self):
+        self.preview_timer.stop()
+        self.preview_path = None
+        if self.preview_player.state() != QMediaPlayer.StoppedState:
+            self.preview_player.stop()
+            self.preview_player.setMedia(QMediaContent())
+
+# ### Table Readahead
+
+READAHEAD_SIDECARS = (".directb2s", ".ini", ".vbs")
+
+class TableReadahead(QObject):
+    """Pulls the selected table's .vpx and sidecar files into the page cache before launch.
+
+    After READAHEAD_DELAY ms on a table, a low-priority thread asks the kernel
+    for readahead (posix_fadvise WILLNEED) and reads the files in chunks so
+    they are really cached; moving on cancels it between chunks. Warmed bytes
+    are capped at READAHEAD_MB, and the least recently warmed files are handed
+    back with DONTNEED. Time spent on those reads is time VPX no longer waits
+    for, and is logged on launch.
+    """
+
+    CHUNK = 1024 * 1024
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.warmed = OrderedDict()  # path -> [bytes warmed, seconds spent reading], oldest first
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._thread = None
+        self._pending = None  # files of the selected table, until READAHEAD_DELAY has passed
+        self._queued = None  # (files, cancel event) handed to the reader thread, not yet picked up
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._start)
+
+    @staticmethod
+    def table_files(table):
+        base = os.path.splitext(table.vpx_file)[0]
+        return [table.vpx_file] + [base + suffix for suffix in READAHEAD_SIDECARS]
+
+    def select(self, table):
+        """Warm table up once it has been selected for READAHEAD_DELAY ms."""
+        self.cancel()
+        if READAHEAD_MB > 0:
+            self._pending = self.table_files(table)
+            self.timer.start(READAHEAD_DELAY)
+
+    def cancel(self):
+        self.timer.stop()
+        self._pending = None
+        with self._lock:
+            self._queued = None
+            self._cancel.set()
+
+    def _start(self):
+        if not self._pending:
+            return
+        with self._lock:
+            self._cancel = threading.Event()
+            self._queued = (self._pending, self._cancel)
+            if self._thread is not None:
+                return  # the reader picks this up once its last read returns (a slow mount can stall it)
+            self._thread = threading.Thread(target=self._reader, name="readahead", daemon=True)
+            self._thread.start()
+
+    def _reader(self):
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)  # per thread on Linux
+        except (AttributeError, OSError):
+            pass
+        while True:
+            with self._lock:
+                request, self._queued = self._queued, None
+                if request is None:
+                    self._thread = None
+                    return
+            try:
+                self._warm(*request)
+            except Exception as e:
+                print(f"Error pre-reading {request[0][0]}: {e}")
+
+    def _warm(self, paths, cancel):
+        budget = READAHEAD_MB * 1024 * 1024
+        buffer = bytearray(self.CHUNK)
+        for path in paths:
+            if cancel.is_set():
+                return
+            try:
+                f = open(path, "rb", buffering=0)
+            except OSError:
+                continue
+            with f:
+                size = os.fstat(f.fileno()).st_size
+                if not size:
+                    continue
+                with self._lock:
+                    entry = self.warmed.pop(path, [0, 0.0])
+                    self.warmed[path] = entry
+                    evicted = []
+                    others = sum(warmed for p, (warmed, _) in self.warmed.items() if p != path)
+                    for p in list(self.warmed):
+                        if others + size <= budget:
+                            break
+                        if p not in paths:
+                            others -= self.warmed.pop(p)[0]
+                            evicted.append(p)
+                    limit = min(size, max(0, budget - others))
+                self._drop(evicted)
+                # Bytes warmed earlier are trusted to still be cached
+                if entry[0] >= limit:
+                    continue
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), entry[0], limit - entry[0], os.POSIX_FADV_WILLNEED)
+                f.seek(entry[0])
+                while entry[0] < limit and not cancel.is_set():
+                    started = time.monotonic()
+                    count = f.readinto(memoryview(buffer)[:min(self.CHUNK, limit - entry[0])])
+                    if not count:
+                        break
+                    with self._lock:
+                        entry[0] += count
+                        entry[1] += time.monotonic() - started
+
+    @staticmethod
+    def _drop(paths):
+        """Tell the kernel the pages of paths are no longer needed."""
+        if not hasattr(os, "posix_fadvise"):
+            return
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+
+    def launched(self, table):
+        """Log how much of table was pre-read and the read time that took off its launch."""
+        with self._lock:
+            entries = [self.warmed.get(path) for path in self.table_files(table)]
+        warmed = sum(entry[0] for entry in entries if entry)
+        seconds = sum(entry[1] for entry in entries if entry)
+        if warmed:
+            print(f"Readahead: {warmed / 1048576:.0f} MB of {table.display_name} pre-read, "
+                  f"~{seconds:.1f} s of launch I/O saved")
 
 # ### Secondary Window
 
@@ -429,72 +2233,96 @@ class SecondaryWindow(QMainWindow):
         self.dmd_label.setStyleSheet("background-color: black;")
         self.dmd_label.setAlignment(Qt.AlignCenter)
 
-    def update_image(self, image_path, table_folder):
+        self.dmd_display = DmdDisplay(self)
+        self.dmd_display.setGeometry(0, BACKGLASS_IMAGE_HEIGHT, DMD_WIDTH, DMD_HEIGHT)
+        self.dmd_display.hide()
+
+        self.snapshot_label = make_snapshot_label(self, SNAPSHOT_BACKGLASS)
+
+    def drop_snapshot(self):
+        """Remove the boot snapshot, revealing live media."""
+        if self.snapshot_label:
+            self.snapshot_label.deleteLater()
+            self.snapshot_label = None
+
+    def update_image(self, image_path, dmd_path):
         """Update backglass and DMD media."""
         if image_path.lower().endswith('.gif') and os.path.exists(image_path):
-            self.backglass_movie = QMovie(image_path)
-            self.backglass_movie.setCacheMode(QMovie.CacheAll)
-            self.backglass_movie.start()
-            frame_size = self.backglass_movie.currentPixmap().size()
-            self.backglass_movie.stop()
-            width, height = frame_size.width(), frame_size.height()
-            if width > 0 and height > 0:
-                aspect_ratio = width / height
-                new_width = min(BACKGLASS_IMAGE_WIDTH, int(BACKGLASS_IMAGE_HEIGHT * aspect_ratio))
-                new_height = min(BACKGLASS_IMAGE_HEIGHT, int(BACKGLASS_IMAGE_WIDTH / aspect_ratio))
-                if new_width > BACKGLASS_IMAGE_WIDTH:
-                    new_width = BACKGLASS_IMAGE_WIDTH
-                    new_height = int(BACKGLASS_IMAGE_WIDTH / aspect_ratio)
-                if new_height > BACKGLASS_IMAGE_HEIGHT:
-                    new_height = BACKGLASS_IMAGE_HEIGHT
-                    new_width = int(BACKGLASS_IMAGE_HEIGHT * aspect_ratio)
+            mapped = get_frame_cache().open(image_path, BACKGLASS_IMAGE_WIDTH, BACKGLASS_IMAGE_HEIGHT) if FRAME_CACHE else None
+            if mapped:
+                self.backglass_movie = mapped
                 self.label.setGeometry(
-                    (BACKGLASS_IMAGE_WIDTH - new_width) // 2,
-                    (BACKGLASS_IMAGE_HEIGHT - new_height) // 2,
-                    new_width, new_height
+                    (BACKGLASS_IMAGE_WIDTH - mapped.width) // 2,
+                    (BACKGLASS_IMAGE_HEIGHT - mapped.height) // 2,
+                    mapped.width, mapped.height
                 )
-                self.backglass_movie.setScaledSize(QSize(new_width, new_height))
-            self.label.setMovie(self.backglass_movie)
-            self.backglass_movie.start()
-        else:
-            pixmap = QPixmap(image_path)
-            if pixmap.isNull():
-                pixmap = QPixmap(BACKGLASS_IMAGE_WIDTH, BACKGLASS_IMAGE_HEIGHT).fill(Qt.black)
+                mapped.frameChanged.connect(lambda image: self.label.setPixmap(QPixmap.fromImage(image)))
+                mapped.start()
             else:
-                pixmap = pixmap.scaled(BACKGLASS_IMAGE_WIDTH, BACKGLASS_IMAGE_HEIGHT,
-                                       Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                self.backglass_movie = QMovie(image_path)
+                self.backglass_movie.setCacheMode(QMovie.CacheAll)
+                self.backglass_movie.start()
+                frame_size = self.backglass_movie.currentPixmap().size()
+                self.backglass_movie.stop()
+                width, height = frame_size.width(), frame_size.height()
+                if width > 0 and height > 0:
+                    new_width, new_height = fit_size(width, height, BACKGLASS_IMAGE_WIDTH, BACKGLASS_IMAGE_HEIGHT)
+                    self.label.setGeometry(
+                        (BACKGLASS_IMAGE_WIDTH - new_width) // 2,
+                        (BACKGLASS_IMAGE_HEIGHT - new_height) // 2,
+                        new_width, new_height
+                    )
+                    self.backglass_movie.setScaledSize(QSize(new_width, new_height))
+                self.label.setMovie(self.backglass_movie)
+                self.backglass_movie.start()
+        else:
+            pixmap = media_cache.pixmap(image_path, BACKGLASS_IMAGE_WIDTH, BACKGLASS_IMAGE_HEIGHT,
+                                        Qt.KeepAspectRatio)
             self.label.setPixmap(pixmap)
+            self.backglass_movie = None
             self.backglass_effect.setOpacity(1.0)
 
-        dmd_path = os.path.join(table_folder, CUSTOM_DMD_VIDEO) if os.path.exists(os.path.join(table_folder, CUSTOM_DMD_VIDEO)) else \
-                   os.path.join(table_folder, CUSTOM_MARQUEE_IMAGE) if os.path.exists(os.path.join(table_folder, CUSTOM_MARQUEE_IMAGE)) else \
-                   DEFAULT_DMD_VIDEO
+        if DMD_DOT_MATRIX and DmdFrameStore.fits(dmd_path, DMD_NATIVE_WIDTH, DMD_NATIVE_HEIGHT):
+            dmd_store = media_cache.dmd_store(dmd_path)
+            if dmd_store:
+                self.dmd_label.clear()
+                self.dmd_label.hide()
+                self.dmd_movie = None
+                self.dmd_display.set_store(dmd_store)
+                self.dmd_display.show()
+                return
+        self.dmd_display.stop()
+        self.dmd_display.hide()
+        self.dmd_label.show()
 
         if dmd_path.lower().endswith('.gif'):
-            self.dmd_movie = QMovie(dmd_path)
-            self.dmd_movie.setCacheMode(QMovie.CacheAll)
-            self.dmd_movie.start()
-            frame_size = self.dmd_movie.currentPixmap().size()
-            self.dmd_movie.stop()
-            width, height = frame_size.width(), frame_size.height()
-            if width > 0 and height > 0:
-                aspect_ratio = width / height
-                new_width = min(DMD_WIDTH, int(DMD_HEIGHT * aspect_ratio))
-                new_height = min(DMD_HEIGHT, int(DMD_WIDTH / aspect_ratio))
-                if new_width > DMD_WIDTH:
-                    new_width = DMD_WIDTH
-                    new_height = int(DMD_WIDTH / aspect_ratio)
-                if new_height > DMD_HEIGHT:
-                    new_height = DMD_HEIGHT
-                    new_width = int(DMD_HEIGHT * aspect_ratio)
-                self.dmd_movie.setScaledSize(QSize(new_width, new_height))
+            mapped = get_frame_cache().open(dmd_path, DMD_WIDTH, DMD_HEIGHT) if FRAME_CACHE else None
+            if mapped:
+                self.dmd_movie = mapped
                 self.dmd_label.setGeometry(
-                    (DMD_WIDTH - new_width) // 2,
-                    BACKGLASS_IMAGE_HEIGHT + (DMD_HEIGHT - new_height) // 2,
-                    new_width, new_height
+                    (DMD_WIDTH - mapped.width) // 2,
+                    BACKGLASS_IMAGE_HEIGHT + (DMD_HEIGHT - mapped.height) // 2,
+                    mapped.width, mapped.height
                 )
-            self.dmd_label.setMovie(self.dmd_movie)
-            self.dmd_movie.start()
+                mapped.frameChanged.connect(lambda image: self.dmd_label.setPixmap(QPixmap.fromImage(image)))
+                mapped.start()
+            else:
+                self.dmd_movie = QMovie(dmd_path)
+                self.dmd_movie.setCacheMode(QMovie.CacheAll)
+                self.dmd_movie.start()
+                frame_size = self.dmd_movie.currentPixmap().size()
+                self.dmd_movie.stop()
+                width, height = frame_size.width(), frame_size.height()
+                if width > 0 and height > 0:
+                    new_width, new_height = fit_size(width, height, DMD_WIDTH, DMD_HEIGHT)
+                    self.dmd_movie.setScaledSize(QSize(new_width, new_height))
+                    self.dmd_label.setGeometry(
+                        (DMD_WIDTH - new_width) // 2,
+                        BACKGLASS_IMAGE_HEIGHT + (DMD_HEIGHT - new_height) // 2,
+                        new_width, new_height
+                    )
+                self.dmd_label.setMovie(self.dmd_movie)
+                self.dmd_movie.start()
         else:
             dmd_pixmap = QPixmap(dmd_path)
             if dmd_pixmap.isNull():
@@ -536,7 +2364,13 @@ class SingleTableViewer(QMainWindow):
         palette.setColor(QPalette.Window, QColor(BG_COLOR))
         self.setPalette(palette)
 
-        self.table_list = load_table_list()
+        self.stats = PlayStats()
+        self.metadata = MetadataCache()
+        self.metadata.updated.connect(self._metadata_updated)
+        self.library = LibraryScanner()
+        self.library.changed.connect(self._library_changed)
+        self._setup_checked = False
+        self.table_list = TableCatalogue()
         self.current_index = 0
 
         central = QWidget(self)
@@ -559,6 +2393,12 @@ class SingleTableViewer(QMainWindow):
         self.table_name_label.setAlignment(Qt.AlignCenter)
         self._set_table_name()
 
+        # **Stale Library Folders**
+        self.stale_label = QLabel(central)
+        self.stale_label.setGeometry(60, 20, MAIN_WINDOW_WIDTH - 120, 30)
+        self.stale_label.setStyleSheet(f"color: {TEXT_COLOR}; font-size: 14px; background: transparent;")
+        self.stale_label.hide()
+
         # **Settings Button**
         self.settingsButton = QPushButton("⚙", central)
         self.settingsButton.setFixedSize(40, 40)
@@ -587,6 +2427,14 @@ class SingleTableViewer(QMainWindow):
         self.wheel_effect = QGraphicsOpacityEffect(self.wheel_label)
         self.wheel_label.setGraphicsEffect(self.wheel_effect)
 
+        # **Wheel Carousel**
+        self.wheel_atlas = WheelAtlas()
+        self.carousel = WheelCarousel(self.wheel_atlas, central)
+        self.carousel.setGeometry(0, wheel_y - WHEEL_CAROUSEL_SIZE - WHEEL_IMAGE_MARGIN,
+                                  MAIN_WINDOW_WIDTH, WHEEL_CAROUSEL_SIZE)
+        self.carousel.setVisible(WHEEL_CAROUSEL_COUNT > 0)
+        self.carousel_index = None
+
         # **Hint Arrows**
         self.left_arrow = QLabel("←", central)
         self.right_arrow = QLabel("→", central)
@@ -602,7 +2450,9 @@ class SingleTableViewer(QMainWindow):
         self.right_arrow_effect = QGraphicsOpacityEffect(self.right_arrow)
         self.left_arrow.setGraphicsEffect(self.left_arrow_effect)
         self.right_arrow.setGraphicsEffect(self.right_arrow_effect)
-        for anim in [QPropertyAnimation(self.left_arrow_effect, b"opacity"), QPropertyAnimation(self.right_arrow_effect, b"opacity")]:
+        self.arrow_animations = [QPropertyAnimation(self.left_arrow_effect, b"opacity"),
+                                 QPropertyAnimation(self.right_arrow_effect, b"opacity")]
+        for anim in self.arrow_animations:
             anim.setDuration(1000)
             anim.setStartValue(1.0)
             anim.setKeyValueAt(0.5, 0.5)
@@ -612,35 +2462,120 @@ class SingleTableViewer(QMainWindow):
             anim.start()
 
         # **Sounds**
-        self.table_change_sound = QSound(SND_TABLE_CHANGE) if os.path.exists(SND_TABLE_CHANGE) else None
-        self.table_load_sound = QSound(SND_TABLE_LOAD) if os.path.exists(SND_TABLE_LOAD) else None
-
-        # **Initial Display**
-        self.update_images()
-
-        # **Validate Configuration at Startup**
+        self.sounds = SoundEngine(self)
+        self.readahead = TableReadahead(self)
+
+        # **Idle Governor**
+        self.governor = IdleGovernor(self)
+
+        # **Boot Snapshot** (saved with the play statistics once the selection settles)
+        self.snapshot_label = make_snapshot_label(self, SNAPSHOT_PLAYFIELD)
+        self.snapshot_timer = QTimer(self)
+        self.snapshot_timer.setSingleShot(True)
+        self.snapshot_timer.setInterval(3000)
+        self.snapshot_timer.timeout.connect(self._save_state)
+
+        # **Initial Display** (after the first frame has been painted)
+        self._media_deferred = False
+        self._resuming = True  # still looking for stats.last_position in the library
+        self._warmed = set()  # ranked tables whose media has been queued for warming
+        QTimer.singleShot(0, self.load_library)
+
+    def load_library(self):
+        """Scan tables and replace the boot snapshot with live media."""
+        self.repaint()
+        if self.secondary:
+            self.secondary.repaint()
+        self.library.scan()
+        self._library_changed()
+
+    def _library_changed(self, reload_media=False):
+        """Rebuild the catalogue from the library folders, keeping the current table selected."""
+        previous = self.table_list[self.current_index] if self.table_list else None
+        self.table_list = self.library.catalogue(self.metadata)
+        # The saved position may sit in a folder that answers late: keep looking for it
+        # until every folder has, unless the user has moved on meanwhile
+        index = self.table_list.index_of(self.stats.last_position) if self._resuming else -1
+        if index >= 0 or self.library.settled():
+            self._resuming = False
+        if index < 0 and previous:
+            index = self.table_list.index_of(previous.vpx_file)
+        self.current_index = max(0, index)
+        current = self.table_list[self.current_index] if self.table_list else None
+        self.carousel_index = None
+        self._update_stale_label()
+        if WHEEL_CAROUSEL_COUNT > 0:
+            self.wheel_atlas.sync(self.table_list)
+        if current and (current.offline or self._resuming) and not self.library.settled():
+            # Keep what is on screen (the boot snapshot) until its folder answers or times out
+            self._media_deferred = True
+            self._set_table_name()
+            self._update_carousel()
+        elif reload_media or self._media_deferred or table_media(current) != table_media(previous):
+            self._media_deferred = False
+            # A stand-in for the saved position is not a position change
+            self.update_images(record_view=not self._resuming)
+        else:
+            self._set_table_name()
+            self._update_carousel()
+        QTimer.singleShot(2000, lambda: self.metadata.refresh(self.table_list))
+        # Each catalogue update may bring ranked tables online, so the warm-up follows it
+        if reload_media:
+            self._warmed.clear()
+        QTimer.singleShot(2000, self._warm_media_cache)
+        self._check_setup()
+
+    def _update_stale_label(self):
+        stale = self.library.stale_roots()
+        self.stale_label.setText("⚠ Offline, showing last known tables: " + ", ".join(stale))
+        self.stale_label.setVisible(bool(stale))
+
+    def _check_setup(self):
+        """Once every library folder has answered, open the settings if nothing is playable."""
+        if self._setup_checked or not self.library.settled():
+            return
+        self._setup_checked = True
         if not self.table_list or not os.path.isfile(VPX_EXECUTABLE) or not os.access(VPX_EXECUTABLE, os.X_OK):
+            self._drop_snapshot()
             if self.openSettings() == QDialog.Rejected:
                 sys.exit(1)
 
+    def _drop_snapshot(self):
+        if self.snapshot_label:
+            self.snapshot_label.deleteLater()
+            self.snapshot_label = None
+        if self.secondary:
+            self.secondary.drop_snapshot()
+
+    def _save_state(self):
+        """Persist the settled position and its snapshot together, so the next boot
+        paints the table it resumes on even after a power cut."""
+        self.stats.save()
+        self._save_snapshots()
+
+    def _save_snapshots(self):
+        """Persist what both windows show for the next cold boot."""
+        if self.snapshot_label or not BOOT_SNAPSHOT:
+            return
+        save_snapshot(self, SNAPSHOT_PLAYFIELD)
+        if self.secondary:
+            save_snapshot(self.secondary, SNAPSHOT_BACKGLASS)
+
     def openSearch(self):
         """Open search dialog and update table if found."""
         dialog = SearchDialog(self)
         if dialog.exec_() == QDialog.Accepted:
-            query = dialog.getSearchQuery().lower()
-            for index, table in enumerate(self.table_list):
-                if query in table["table_name"].lower():
-                    self.current_index = index
-                    self.update_images()
-                    break
+            index = self.table_list.find(dialog.getSearchQuery())
+            if index >= 0:
+                self.current_index = index
+                self.update_images()
             else:
                 QMessageBox.information(self, "Search", "No matching table found.")
 
     def _set_table_name(self):
         """Set the current table name."""
         if self.table_list:
-            table_name = os.path.splitext(os.path.basename(self.table_list[self.current_index]["vpx_file"]))[0]
-            self.table_name_label.setText(table_name)
+            self.table_name_label.setText(self.table_list[self.current_index].display_name)
             self.table_name_label.setFont(QFont(FONT_NAME, FONT_SIZE))
             self._update_table_name_label_geometry()
 
@@ -655,53 +2590,64 @@ class SingleTableViewer(QMainWindow):
             text_width + 2 * padding, label_height + 2 * padding
         )
 
-    def update_images(self):
+    def update_images(self, record_view=True):
         """Update all images with fade animation."""
         if not self.table_list:
             return
         table = self.table_list[self.current_index]
         playing_gif = False
 
-        if table["table_img"].lower().endswith('.gif') and os.path.exists(table["table_img"]):
-            self.table_movie = QMovie(table["table_img"])
-            self.table_movie.setCacheMode(QMovie.CacheAll)
-            self.table_movie.start()
-            frame_size = self.table_movie.currentPixmap().size()
-            self.table_movie.stop()
-            if frame_size.width() > 0 and frame_size.height() > 0:
-                aspect_ratio = frame_size.width() / frame_size.height()
-                new_width = min(MAIN_WINDOW_WIDTH, int(MAIN_WINDOW_HEIGHT * aspect_ratio))
-                new_height = min(MAIN_WINDOW_HEIGHT, int(MAIN_WINDOW_WIDTH / aspect_ratio))
-                if new_width > MAIN_WINDOW_WIDTH:
-                    new_width = MAIN_WINDOW_WIDTH
-                    new_height = int(MAIN_WINDOW_WIDTH / aspect_ratio)
-                if new_height > MAIN_WINDOW_HEIGHT:
-                    new_height = MAIN_WINDOW_HEIGHT
-                    new_width = int(MAIN_WINDOW_HEIGHT * aspect_ratio)
-                self.table_movie.setScaledSize(QSize(new_width, new_height))
+        if table.table_img.lower().endswith('.gif') and os.path.exists(table.table_img):
+            mapped = get_frame_cache().open(table.table_img, MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT) if FRAME_CACHE else None
+            if mapped:
+                self.table_movie = mapped
                 self.table_label.setGeometry(
-                    (MAIN_WINDOW_WIDTH - new_width) // 2,
-                    (MAIN_WINDOW_HEIGHT - new_height) // 2,
-                    new_width, new_height
+                    (MAIN_WINDOW_WIDTH - mapped.width) // 2,
+                    (MAIN_WINDOW_HEIGHT - mapped.height) // 2,
+                    mapped.width, mapped.height
                 )
-            self.table_label.setMovie(self.table_movie)
-            self.table_movie.start()
+                mapped.frameChanged.connect(lambda image: self.table_label.setPixmap(QPixmap.fromImage(image)))
+                mapped.start()
+            else:
+                self.table_movie = QMovie(table.table_img)
+                self.table_movie.setCacheMode(QMovie.CacheAll)
+                self.table_movie.start()
+                frame_size = self.table_movie.currentPixmap().size()
+                self.table_movie.stop()
+                if frame_size.width() > 0 and frame_size.height() > 0:
+                    new_width, new_height = fit_size(frame_size.width(), frame_size.height(),
+                                                     MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT)
+                    self.table_movie.setScaledSize(QSize(new_width, new_height))
+                    self.table_label.setGeometry(
+                        (MAIN_WINDOW_WIDTH - new_width) // 2,
+                        (MAIN_WINDOW_HEIGHT - new_height) // 2,
+                        new_width, new_height
+                    )
+                self.table_label.setMovie(self.table_movie)
+                self.table_movie.start()
             playing_gif = True
         else:
-            table_pixmap = QPixmap(table["table_img"])
-            if table_pixmap.isNull():
-                table_pixmap = QPixmap(MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT).fill(Qt.black)
-            table_scaled = table_pixmap.scaled(MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT,
-                                               Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+            table_scaled = media_cache.pixmap(table.table_img, MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT,
+                                              Qt.KeepAspectRatioByExpanding)
             self.table_label.setPixmap(table_scaled)
+            self.table_movie = None
+
+        wheel_img = DEFAULT_WHEEL_IMAGE if table.offline else table.wheel_img
+        wheel_scaled = media_cache.pixmap(wheel_img, WHEEL_IMAGE_SIZE, WHEEL_IMAGE_SIZE, Qt.KeepAspectRatio)
+        self.stats.viewed(table.vpx_file, counted=record_view)
+        if record_view:
+            self._resuming = False
+        if record_view and not table.offline:
+            self.sounds.preview(table.folder)
+            self.readahead.select(table)
+        else:
+            self.sounds.stop_preview()
+            self.readahead.cancel()
+        self._update_carousel()
+        count = len(self.table_list)
+        media_cache.prefetch([self.table_list[(self.current_index + step) % count] for step in (1, -1)])
 
-        wheel_pixmap = QPixmap(table["wheel_img"])
-        if wheel_pixmap.isNull():
-            wheel_pixmap = QPixmap(WHEEL_IMAGE_SIZE, WHEEL_IMAGE_SIZE).fill(Qt.transparent)
-        wheel_scaled = wheel_pixmap.scaled(WHEEL_IMAGE_SIZE, WHEEL_IMAGE_SIZE,
-                                           Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-        self.table_name_label.setText(os.path.splitext(os.path.basename(table["vpx_file"]))[0])
+        self.table_name_label.setText(table.display_name)
         self.table_name_label.setStyleSheet(f"color: {TEXT_COLOR}; background-color: {BG_COLOR};")
         self._update_table_name_label_geometry()
 
@@ -726,7 +2672,7 @@ class SingleTableViewer(QMainWindow):
             self.fade_out_backglass.setEasingCurve(QEasingCurve.InQuad)
 
         self.fade_out_table.finished.connect(lambda: self._set_new_images(
-            None if playing_gif else table_scaled, wheel_scaled, table["backglass_img"], table["folder"]
+            None if playing_gif else table_scaled, wheel_scaled, table.backglass_img, table.dmd_img, record_view
         ))
 
         self.fade_out_table.start()
@@ -734,13 +2680,20 @@ class SingleTableViewer(QMainWindow):
         if self.secondary and hasattr(self, 'fade_out_backglass'):
             self.fade_out_backglass.start()
 
-    def _set_new_images(self, table_pixmap, wheel_pixmap, backglass_path, table_folder):
+    def _set_new_images(self, table_pixmap, wheel_pixmap, backglass_path, dmd_path, record_view=True):
         """Set new images and fade in."""
         if table_pixmap:
             self.table_label.setPixmap(table_pixmap)
         self.wheel_label.setPixmap(wheel_pixmap)
         if self.secondary:
-            self.secondary.update_image(backglass_path, table_folder)
+            self.secondary.update_image(backglass_path, dmd_path)
+        if self.snapshot_label:
+            QTimer.singleShot(FADE_DURATION // 2, self._drop_snapshot)
+        if record_view:
+            # Attract mode would otherwise rewrite both raw snapshots on every step, all day
+            self.snapshot_timer.start()
+        if self.governor.speed < 100:
+            self.set_animation_speed(self.governor.speed)
 
         self.fade_in_table = QPropertyAnimation(self.table_effect, b"opacity")
         self.fade_in_table.setDuration(FADE_DURATION // 2)
@@ -769,17 +2722,102 @@ class SingleTableViewer(QMainWindow):
         if not self.table_list:
             return
         table = self.table_list[self.current_index]
-        command = [VPX_EXECUTABLE, EXECUTABLE_SUB_CMD, table["vpx_file"]]
-        if self.table_load_sound:
-            self.table_load_sound.play()
+        command = [VPX_EXECUTABLE, EXECUTABLE_SUB_CMD, table.vpx_file]
+        self.sounds.stop_preview()
+        self.sounds.play("load")
+        self.readahead.launched(table)
+        self.stats.launched(table.vpx_file)
+        self.stats.save()
+        self.governor.pause()
         try:
             subprocess.Popen(command).wait()
         except Exception as e:
-            print(f"Error launching {table['vpx_file']}: {e}")
+            print(f"Error launching {table.vpx_file}: {e}")
+        self.governor.resume()
+        self.stats.viewed(table.vpx_file)
+
+    def _update_carousel(self):
+        """Center the carousel on the current table, sliding if it moved by one."""
+        count = len(self.table_list)
+        direction = 0
+        if self.carousel_index is not None and count > 2:
+            if self.current_index == (self.carousel_index + 1) % count:
+                direction = 1
+            elif self.current_index == (self.carousel_index - 1) % count:
+                direction = -1
+        self.carousel_index = self.current_index
+        self.carousel.set_index(self.table_list, self.current_index, direction)
+
+    def set_animation_speed(self, percent):
+        """Run every looping animation on both windows at percent speed; 0 freezes them."""
+        movies = [getattr(self, "table_movie", None)]
+        if self.secondary:
+            movies += [getattr(self.secondary, "backglass_movie", None), getattr(self.secondary, "dmd_movie", None)]
+            self.secondary.dmd_display.set_speed(percent)
+        for movie in movies:
+            if movie:
+                movie.setPaused(percent == 0)
+                if percent:
+                    movie.setSpeed(percent)
+        for anim in self.arrow_animations:
+            if percent == 0:
+                anim.pause()
+            else:
+                anim.setDuration(100000 // percent)
+                if anim.state() == QAbstractAnimation.Paused:
+                    anim.resume()
+
+    def attract_step(self):
+        """Advance to the next table without sounds or play statistics."""
+        if self.table_list:
+            self.current_index = (self.current_index + 1) % len(self.table_list)
+            self.update_images(record_view=False)
+
+    def _metadata_updated(self):
+        """Re-apply fresh TableInfo metadata and re-sort, keeping the current table selected."""
+        if not self.table_list:
+            return
+        current = self.table_list[self.current_index]
+        current_img = current.table_img
+        for table in self.table_list:
+            table.set_metadata(self.metadata.get(table.vpx_file))
+        self.table_list = TableCatalogue(self.table_list)
+        self.current_index = max(0, self.table_list.index_of(current.vpx_file))
+        self.carousel_index = None
+        if current.table_img != current_img:
+            self.update_images(record_view=False)
+        else:
+            self._set_table_name()
+            self._update_carousel()
+
+    def _warm_media_cache(self):
+        """Decode the media of the most played and most recently viewed tables in the background.
+
+        Tables not in the catalogue yet, or still offline, are picked up by a later call.
+        """
+        tables = []
+        for vpx_file in self.stats.ranked(WARM_CACHE_TABLES):
+            index = self.table_list.index_of(vpx_file)
+            if vpx_file not in self._warmed and index >= 0 and not self.table_list[index].offline:
+                tables.append(self.table_list[index])
+                self._warmed.add(vpx_file)
+        if not tables:
+            return
+        media_cache.warm(tables)
+        if FRAME_CACHE:
+            frame_cache = get_frame_cache()
+            for table in tables:
+                if table.table_img.lower().endswith('.gif'):
+                    frame_cache.request(table.table_img, MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT)
+                if table.backglass_img.lower().endswith('.gif'):
+                    frame_cache.request(table.backglass_img, BACKGLASS_IMAGE_WIDTH, BACKGLASS_IMAGE_HEIGHT)
+                if table.dmd_img.lower().endswith('.gif') and not (
+                        DMD_DOT_MATRIX and DmdFrameStore.fits(table.dmd_img, DMD_NATIVE_WIDTH, DMD_NATIVE_HEIGHT)):
+                    frame_cache.request(table.dmd_img, DMD_WIDTH, DMD_HEIGHT)
 
     def openSettings(self):
         """Open settings dialog and apply changes if accepted."""
-        dialog = SettingsDialog(self)
+        dialog = SettingsDialog(self, self.library)
         result = dialog.exec_()
         if result == QDialog.Accepted:
             values = dialog.getValues()
@@ -788,6 +2826,7 @@ class SingleTableViewer(QMainWindow):
                 "VPX_ROOT_FOLDER": values["VPX_ROOT_FOLDER"],
                 "VPX_EXECUTABLE": values["VPX_EXECUTABLE"],
                 "EXECUTABLE_SUB_CMD": values["EXECUTABLE_SUB_CMD"],
+                "ROOT_SCAN_TIMEOUT": values["ROOT_SCAN_TIMEOUT"],
             }
             config['Custom Media'] = {
                 "CUSTOM_TABLE_IMAGE": values["CUSTOM_TABLE_IMAGE"],
@@ -797,6 +2836,7 @@ class SingleTableViewer(QMainWindow):
                 "CUSTOM_TABLE_VIDEO": values["CUSTOM_TABLE_VIDEO"],
                 "CUSTOM_BACKGLASS_VIDEO": values["CUSTOM_BACKGLASS_VIDEO"],
                 "CUSTOM_DMD_VIDEO": values["CUSTOM_DMD_VIDEO"],
+                "CUSTOM_TABLE_AUDIO": values["CUSTOM_TABLE_AUDIO"],
             }
             config['Main Window'] = {
                 "MAIN_MONITOR_INDEX": values["MAIN_MONITOR_INDEX"],
@@ -804,10 +2844,14 @@ class SingleTableViewer(QMainWindow):
                 "MAIN_WINDOW_HEIGHT": values["MAIN_WINDOW_HEIGHT"],
                 "WHEEL_IMAGE_SIZE": values["WHEEL_IMAGE_SIZE"],
                 "WHEEL_IMAGE_MARGIN": values["WHEEL_IMAGE_MARGIN"],
+                "WHEEL_CAROUSEL_COUNT": values["WHEEL_CAROUSEL_COUNT"],
+                "WHEEL_CAROUSEL_SIZE": values["WHEEL_CAROUSEL_SIZE"],
                 "FONT_NAME": values["FONT_NAME"],
                 "FONT_SIZE": values["FONT_SIZE"],
                 "BG_COLOR": values["BG_COLOR"],
                 "TEXT_COLOR": values["TEXT_COLOR"],
+                "METADATA_NAMES": values["METADATA_NAMES"],
+                "TABLE_SORT": values["TABLE_SORT"],
             }
             config['Secondary Window'] = {
                 "SECONDARY_MONITOR_INDEX": values["SECONDARY_MONITOR_INDEX"],
@@ -817,24 +2861,44 @@ class SingleTableViewer(QMainWindow):
                 "BACKGLASS_IMAGE_HEIGHT": values["BACKGLASS_IMAGE_HEIGHT"],
                 "DMD_WIDTH": values["DMD_WIDTH"],
                 "DMD_HEIGHT": values["DMD_HEIGHT"],
+                "DMD_DOT_MATRIX": values["DMD_DOT_MATRIX"],
+                "DMD_NATIVE_WIDTH": values["DMD_NATIVE_WIDTH"],
+                "DMD_NATIVE_HEIGHT": values["DMD_NATIVE_HEIGHT"],
             }
             config['Transition Settings'] = {
                 "FADE_DURATION": values["FADE_DURATION"],
                 "FADE_OPACITY": values["FADE_OPACITY"],
             }
+            config['Performance'] = {
+                "MEDIA_CACHE_MB": values["MEDIA_CACHE_MB"],
+                "WARM_CACHE_TABLES": values["WARM_CACHE_TABLES"],
+                "BOOT_SNAPSHOT": values["BOOT_SNAPSHOT"],
+                "IDLE_TIERS": values["IDLE_TIERS"],
+                "ATTRACT_MODE_INTERVAL": values["ATTRACT_MODE_INTERVAL"],
+                "FRAME_CACHE": values["FRAME_CACHE"],
+                "FRAME_CACHE_MB": values["FRAME_CACHE_MB"],
+                "METADATA_WORKERS": values["METADATA_WORKERS"],
+                "READAHEAD_DELAY": values["READAHEAD_DELAY"],
+                "READAHEAD_MB": values["READAHEAD_MB"],
+            }
+            config['Sound'] = {
+                "SOUND_VOLUME": values["SOUND_VOLUME"],
+                "SOUND_POLYPHONY": values["SOUND_POLYPHONY"],
+                "SOUND_REPEAT_INTERVAL": values["SOUND_REPEAT_INTERVAL"],
+                "TABLE_PREVIEW": values["TABLE_PREVIEW"],
+                "PREVIEW_VOLUME": values["PREVIEW_VOLUME"],
+                "PREVIEW_DELAY": values["PREVIEW_DELAY"],
+            }
             ini_file = os.path.expanduser(CONFIG_FILE)
             os.makedirs(os.path.dirname(ini_file), exist_ok=True)
             with open(ini_file, "w") as f:
                 config.write(f)
             load_configuration()
             self.apply_settings()
-            self.table_list = load_table_list()
-            if not self.table_list:
-                QMessageBox.critical(self, "Error", "No tables found after updating settings.")
-                sys.exit(1)
-            if self.current_index >= len(self.table_list):
-                self.current_index = 0
-            self.update_images()
+            self.sounds.reload()
+            self._setup_checked = False
+            self.library.scan()
+            self._library_changed(reload_media=True)
         self.setFocus()
         return result
 
@@ -845,27 +2909,31 @@ class SingleTableViewer(QMainWindow):
         self.table_name_label.setFont(QFont(FONT_NAME, FONT_SIZE))
         self.table_name_label.setStyleSheet(f"color: {TEXT_COLOR}; background-color: {BG_COLOR};")
         self.settingsButton.move(MAIN_WINDOW_WIDTH - 50, 10)
+        self.stale_label.setGeometry(60, 20, MAIN_WINDOW_WIDTH - 120, 30)
         wheel_x = MAIN_WINDOW_WIDTH - WHEEL_IMAGE_SIZE - WHEEL_IMAGE_MARGIN
         wheel_y = MAIN_WINDOW_HEIGHT - WHEEL_IMAGE_SIZE - WHEEL_IMAGE_MARGIN
         self.wheel_label.setGeometry(wheel_x, wheel_y, WHEEL_IMAGE_SIZE, WHEEL_IMAGE_SIZE)
+        self.carousel.setGeometry(0, wheel_y - WHEEL_CAROUSEL_SIZE - WHEEL_IMAGE_MARGIN,
+                                  MAIN_WINDOW_WIDTH, WHEEL_CAROUSEL_SIZE)
+        self.carousel.setVisible(WHEEL_CAROUSEL_COUNT > 0)
         self._set_table_name()
+        self.governor.load_tiers()
         if self.secondary:
             self.secondary.setFixedSize(BACKGLASS_WINDOW_WIDTH, BACKGLASS_WINDOW_HEIGHT)
             self.secondary.label.setGeometry(0, 0, BACKGLASS_IMAGE_WIDTH, BACKGLASS_IMAGE_HEIGHT)
             self.secondary.dmd_label.setGeometry(0, BACKGLASS_IMAGE_HEIGHT, DMD_WIDTH, DMD_HEIGHT)
+            self.secondary.dmd_display.setGeometry(0, BACKGLASS_IMAGE_HEIGHT, DMD_WIDTH, DMD_HEIGHT)
 
     def keyPressEvent(self, event):
         """Handle navigation and table launch."""
         if event.key() == Qt.Key_Left and self.table_list:
             self.current_index = (self.current_index - 1) % len(self.table_list)
+            self.sounds.play("change", event.isAutoRepeat())  # before any decoding, so it is heard at once
             self.update_images()
-            if self.table_change_sound:
-                self.table_change_sound.play()
         elif event.key() == Qt.Key_Right and self.table_list:
             self.current_index = (self.current_index + 1) % len(self.table_list)
+            self.sounds.play("change", event.isAutoRepeat())
             self.update_images()
-            if self.table_change_sound:
-                self.table_change_sound.play()
         elif event.key() in (Qt.Key_Return, Qt.Key_Enter):
             self.launch_table()
         elif event.key() == Qt.Key_Escape or event.key() == Qt.Key_Q:
@@ -874,6 +2942,13 @@ class SingleTableViewer(QMainWindow):
             super().keyPressEvent(event)
 
     def closeEvent(self, event):
+        self.sounds.stop_preview()
+        self.readahead.cancel()
+        self.stats.save()
+        if self.governor.tier or len(self.governor.cpu) > 1:
+            print(self.governor.report())
+        if self.snapshot_timer.isActive():
+            self._save_snapshots()
         if self.secondary:
             self.secondary.close()
         event.accept()
@@ -881,6 +2956,9 @@ class SingleTableViewer(QMainWindow):
 # ### Main Entry Point
 
 if __name__ == "__main__":
+    # Only here, not at import: the metadata process pool re-imports this file in every worker
+    load_configuration()
+
     if os.environ.get("XDG_SESSION_TYPE", "unknown").lower() == "wayland":
         print("Running under Wayland. For precise window positioning, consider launching with QT_QPA_PLATFORM=xcb")
 
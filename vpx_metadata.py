@@ -0,0 +1,201 @@
+"""
+Table info reader for ASAP-CABINET-FE.
+
+.vpx tables are OLE compound files that carry their name, author, version,
+release date and a screenshot in a TableInfo storage. This module has no
+side effects on import and no Qt dependency, so the front-end's process pool
+can run extract_vpx_metadata() without dragging the GUI along.
+"""
+
+import os
+import struct
+import hashlib
+
+class CompoundFile:
+    """Minimal read-only reader for OLE compound files, the container format of .vpx tables.
+
+    Only the header, FAT, directory and mini FAT are loaded; streams are read
+    sector by sector on demand, so pulling the TableInfo strings out of a
+    200 MB table touches well under a megabyte.
+    """
+
+    SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+    MAX_REGULAR_SECTOR = 0xFFFFFFFA
+    NO_STREAM = 0xFFFFFFFF
+    STORAGE, STREAM = 1, 2
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        try:
+            self._read_header()
+            self._read_directory()
+        except Exception:
+            self.file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.file.close()
+
+    def _read_header(self):
+        header = self.file.read(512)
+        if len(header) < 512 or header[:8] != self.SIGNATURE:
+            raise ValueError("not a compound file")
+        self.sector_shift, self.mini_shift = struct.unpack_from("<HH", header, 30)
+        if not 9 <= self.sector_shift <= 12 or self.mini_shift >= self.sector_shift:
+            raise ValueError("bad sector size")
+        self.sector_size = 1 << self.sector_shift
+        (fat_count, self.dir_start, _, self.mini_cutoff, minifat_start,
+         _, difat_sector, difat_count) = struct.unpack_from("<8I", header, 44)
+
+        fat_sectors = list(struct.unpack_from("<109I", header, 76))
+        per_sector = self.sector_size // 4
+        for _ in range(difat_count):
+            if difat_sector >= self.MAX_REGULAR_SECTOR:
+                break
+            values = struct.unpack(f"<{per_sector}I", self._sector(difat_sector))
+            fat_sectors.extend(values[:-1])
+            difat_sector = values[-1]
+        self.fat = b"".join(self._sector(sector) for sector in fat_sectors[:fat_count]
+                            if sector < self.MAX_REGULAR_SECTOR)
+        self.minifat = b"".join(self._sector(sector) for sector in self._chain(self.fat, minifat_start))
+
+    def _read_directory(self):
+        data = b"".join(self._sector(sector) for sector in self._chain(self.fat, self.dir_start))
+        entries = []
+        for offset in range(0, len(data) - 127, 128):
+            name_length, kind, _, left, right, child = struct.unpack_from("<HBBIII", data, offset + 64)
+            start, size = struct.unpack_from("<IQ", data, offset + 116)
+            if self.sector_shift == 9:
+                size &= 0xFFFFFFFF  # the high half is undefined in version 3 files
+            name = data[offset:offset + max(0, min(name_length, 64) - 2)].decode("utf-16-le", "replace")
+            entries.append((name, kind, left, right, child, start, size))
+        if not entries:
+            raise ValueError("empty directory")
+
+        # Flatten the red-black sibling trees into "Storage/Stream" paths
+        self.streams = {}
+        visited = set()
+        stack = [(entries[0][4], "")]
+        while stack:
+            index, prefix = stack.pop()
+            if index >= len(entries) or index in visited:
+                continue
+            visited.add(index)
+            name, kind, left, right, child, start, size = entries[index]
+            stack.append((left, prefix))
+            stack.append((right, prefix))
+            if kind == self.STORAGE:
+                stack.append((child, prefix + name + "/"))
+            elif kind == self.STREAM:
+                self.streams[(prefix + name).lower()] = (start, size)
+        self.mini_stream = list(self._chain(self.fat, entries[0][5]))
+
+    def _sector(self, sector):
+        self.file.seek((sector + 1) << self.sector_shift)
+        return self.file.read(self.sector_size)
+
+    @staticmethod
+    def _chain(table, start):
+        """Yield the sectors of the chain starting at start in a FAT or mini FAT."""
+        limit = len(table) // 4
+        sector = start
+        for _ in range(limit + 1):
+            if sector >= limit:
+                return
+            yield sector
+            sector = struct.unpack_from("<I", table, sector * 4)[0]
+        raise ValueError("sector chain loops")
+
+    def read(self, path, limit=None):
+        """Return the contents of stream path ("Storage/Stream"), at most limit bytes.
+
+        Raises KeyError if the stream does not exist.
+        """
+        start, size = self.streams[path.lower()]
+        # The stream's real size decides where it lives; limit only truncates
+        in_mini_stream = size < self.mini_cutoff
+        remaining = size if limit is None else min(size, limit)
+        chunks = []
+        if in_mini_stream:
+            mini_size = 1 << self.mini_shift
+            for mini_sector in self._chain(self.minifat, start):
+                if remaining <= 0:
+                    break
+                offset = mini_sector << self.mini_shift
+                sector = self.mini_stream[offset >> self.sector_shift]
+                self.file.seek(((sector + 1) << self.sector_shift) + (offset & (self.sector_size - 1)))
+                chunks.append(self.file.read(min(mini_size, remaining)))
+                remaining -= mini_size
+        else:
+            for sector in self._chain(self.fat, start):
+                if remaining <= 0:
+                    break
+                self.file.seek((sector + 1) << self.sector_shift)
+                chunks.append(self.file.read(min(self.sector_size, remaining)))
+                remaining -= self.sector_size
+        return b"".join(chunks)
+
+VPX_INFO_STREAMS = {
+    "name": "TableInfo/TableName",
+    "author": "TableInfo/AuthorName",
+    "version": "TableInfo/TableVersion",
+    "release": "TableInfo/ReleaseDate",
+}
+VPX_SCREENSHOT_STREAM = "TableInfo/Screenshot"
+SCREENSHOT_MAX_BYTES = 32 * 1024 * 1024
+
+def image_suffix(data):
+    """File suffix for encoded image data, or None if it is not a known format."""
+    if data.startswith(b"\x89PNG"):
+        return ".png"
+    if data.startswith(b"\xff\xd8"):
+        return ".jpg"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return ".gif"
+    if data.startswith(b"BM"):
+        return ".bmp"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+def extract_vpx_metadata(vpx_file, screenshot_dir):
+    """Read the TableInfo fields of a .vpx and save its embedded screenshot.
+
+    Runs in a worker process, so it only takes and returns plain data. The
+    returned entry always carries the size and mtime it was read at, even if
+    the file could not be parsed, so broken tables are not retried every boot.
+    """
+    stat = os.stat(vpx_file)
+    entry = {"size": stat.st_size, "mtime": stat.st_mtime}
+    try:
+        with CompoundFile(vpx_file) as table:
+            for key, stream in VPX_INFO_STREAMS.items():
+                try:
+                    text = table.read(stream, 4096).decode("utf-16-le", "replace")
+                except KeyError:
+                    continue
+                text = " ".join(text.replace("\x00", " ").split())
+                if text:
+                    entry[key] = text
+            try:
+                data = table.read(VPX_SCREENSHOT_STREAM, SCREENSHOT_MAX_BYTES)
+            except KeyError:
+                data = b""
+        suffix = image_suffix(data)
+        if suffix:
+            name = hashlib.sha1(vpx_file.encode("utf-8", "surrogateescape")).hexdigest()
+            path = os.path.join(screenshot_dir, name + suffix)
+            os.makedirs(screenshot_dir, exist_ok=True)
+            with open(path + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+            entry["screenshot"] = path
+    except Exception as e:
+        print(f"Error reading table info from {vpx_file}: {e}")
+    return entry